@@ -9,17 +9,201 @@ needing to write USD syntax directly.
 
 import sys
 import os
+from functools import lru_cache
 from PySide2 import QtWidgets, QtCore, QtGui
 from pxr import Usd, UsdGeom, Sdf, Tf
 
+_ENTITY_PARENT_SCHEMAS = ("Typed", "GeomXformable", "GeomMesh", "GeomBasisCurves")
+_API_PARENT_SCHEMAS = ("APISchemaBase",)
+
+_USDA_HEADER = "#usda 1.0\n\n"
+
+_GLOBAL_HEADER_TMPL = (
+    'over "GLOBAL" (\n'
+    '    customData = {{\n'
+    '        string libraryName = "{lib}"\n'
+    '        string libraryPath = "./"\n'
+    '        string libraryPrefix = "{lib}"\n'
+    '        bool skipCodeGeneration = true\n'
+    '    }}\n'
+    ') {{\n'
+    '}}\n\n'
+)
+
+
+@lru_cache(maxsize=32)
+def _formatGlobalHeader(libraryName):
+    """Format the GLOBAL library section, which only varies by library name"""
+    return _GLOBAL_HEADER_TMPL.format(lib=libraryName)
+
+
+_ENTITY_CLASS_TMPL = (
+    'class "{name}" (\n'
+    '    inherits = </{parent}>\n'
+    '{docLine}'
+    ') {{\n'
+)
+
+_API_CLASS_TMPL = (
+    'class "{name}API" (\n'
+    '    inherits = </{parent}>\n'
+    '    customData = {{\n'
+    '        token apiSchemaType = "{apiType}"\n'
+    '{namespaceLine}'
+    '    }}\n'
+    '{docLine}'
+    ') {{\n'
+)
+
+_DOC_LINE_TMPL = '    doc = """{doc}"""\n'
+
+_NAMESPACE_LINE_TMPL = '        token propertyNamespacePrefix = "{namespace}"\n'
+
+
+@lru_cache(maxsize=32)
+def _buildClassHeader(schemaType, schemaName, parentSchema, doc, namespace):
+    """Format the schema class opening, up to and including its brace"""
+    fields = {
+        "name": schemaName,
+        "parent": parentSchema,
+        "docLine": _DOC_LINE_TMPL.format(doc=doc) if doc else "",
+    }
+    if schemaType == 0:  # Entity Schema
+        return _ENTITY_CLASS_TMPL.format_map(fields)
+    
+    # API Schema, with a namespace prefix for multiple-apply
+    fields["apiType"] = "singleApply" if schemaType == 1 else "multipleApply"
+    fields["namespaceLine"] = (
+        _NAMESPACE_LINE_TMPL.format(namespace=namespace) if schemaType == 2 else ""
+    )
+    return _API_CLASS_TMPL.format_map(fields)
+
+
+def _quoteValue(value):
+    """Format a value as a quoted USDA string"""
+    return f'"{value}"'
+
+
+# USDA value formatter per property type; anything else is quoted
+_VALUE_FORMATTERS = {
+    "float": str,
+    "int": str,
+    "bool": lambda value: "true" if value else "false",
+}
+
+
+@lru_cache(maxsize=1024)
+def _buildPropertyLine(propType, propName, propValue):
+    """Format a single property declaration"""
+    # Format property value based on type
+    valueStr = _VALUE_FORMATTERS.get(propType, _quoteValue)(propValue)
+    return f'    {propType} {propName} = {valueStr}\n'
+
+
+def _iterUsdaChunks(state):
+    """Yield the USDA text for a SchemaEditor._previewStateKey() snapshot"""
+    schemaType, schemaName, parentSchema, libraryName, doc, namespace, props = state
+    
+    # Start with USDA header and GLOBAL section
+    yield _USDA_HEADER
+    yield _formatGlobalHeader(libraryName)
+    yield _buildClassHeader(schemaType, schemaName, parentSchema, doc, namespace)
+    
+    # Add properties
+    for propName, propType, propValue in props:
+        yield _buildPropertyLine(propType, propName, propValue)
+    
+    # Close class
+    yield '}\n'
+
+
+@lru_cache(maxsize=128)
+def _buildPreview(state):
+    """Generate USDA text from a SchemaEditor._previewStateKey() snapshot"""
+    return "".join(_iterUsdaChunks(state))
+
+
+def _makeNumberEditor(defaultValue, validator, convert):
+    """Create a validated line edit that reads back as a number"""
+    # A single QLineEdit is much cheaper to create than a spin box, which
+    # carries its own line edit, step buttons and repeat timer
+    editor = QtWidgets.QLineEdit()
+    validator.setParent(editor)
+    editor.setValidator(validator)
+    editor.setText(str(convert(defaultValue)) if defaultValue is not None else "0")
+    
+    def getValue():
+        # Intermediate input such as "-" or "1e" passes the validator
+        try:
+            return convert(editor.text())
+        except ValueError:
+            return convert(0)
+    
+    return editor, editor.textChanged, getValue
+
+
+def _makeFloatEditor(defaultValue):
+    """Create a float editor, returning (editor, changed signal, getter)"""
+    validator = QtGui.QDoubleValidator(-10000, 10000, 6)
+    return _makeNumberEditor(defaultValue, validator, float)
+
+
+def _makeIntEditor(defaultValue):
+    """Create an int editor, returning (editor, changed signal, getter)"""
+    validator = QtGui.QIntValidator(-10000, 10000)
+    return _makeNumberEditor(defaultValue, validator, int)
+
+
+def _makeTokenEditor(defaultValue, tokenValues=()):
+    """Create a token editor, returning (editor, changed signal, getter)"""
+    editor = QtWidgets.QComboBox()
+    # Add allowed token values
+    if tokenValues:
+        editor.addItems(list(tokenValues))
+    if defaultValue is not None:
+        editor.setCurrentText(str(defaultValue))
+    return editor, editor.currentTextChanged, editor.currentText
+
+
+def _makeStringEditor(defaultValue):
+    """Create a string editor, returning (editor, changed signal, getter)"""
+    editor = QtWidgets.QLineEdit()
+    if defaultValue is not None:
+        editor.setText(str(defaultValue))
+    return editor, editor.textChanged, editor.text
+
+
+def _makeBoolEditor(defaultValue):
+    """Create a bool editor, returning (editor, changed signal, getter)"""
+    editor = QtWidgets.QCheckBox()
+    if defaultValue is not None:
+        editor.setChecked(bool(defaultValue))
+    return editor, editor.stateChanged, editor.isChecked
+
+
+# Editor factory per property type; unlisted types get a plain line edit
+_EDITOR_FACTORIES = {
+    "float": _makeFloatEditor,
+    "int": _makeIntEditor,
+    "token": _makeTokenEditor,
+    "string": _makeStringEditor,
+    "bool": _makeBoolEditor,
+}
+
+
 class SchemaPropertyWidget(QtWidgets.QWidget):
     """Widget for editing a single schema property"""
     
     propertyChanged = QtCore.Signal()
     
-    def __init__(self, propertyName, propertyType, defaultValue=None, parent=None):
+    def __init__(self, propertyName, propertyType, defaultValue=None, tokenValues=None, parent=None):
         super().__init__(parent)
         
+        # Plain Python copies of the row's data, so preview generation
+        # never has to query the child widgets
+        self._propertyName = propertyName
+        self._propertyType = propertyType
+        
         # Create layout
         layout = QtWidgets.QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -36,42 +220,13 @@ class SchemaPropertyWidget(QtWidgets.QWidget):
         layout.addWidget(self.typeLabel)
         
         # Create appropriate editor based on type
-        if propertyType == "float":
-            self.editor = QtWidgets.QDoubleSpinBox()
-            self.editor.setRange(-10000, 10000)
-            self.editor.setSingleStep(0.1)
-            if defaultValue is not None:
-                self.editor.setValue(float(defaultValue))
-            self.editor.valueChanged.connect(self._emitChange)
-        elif propertyType == "int":
-            self.editor = QtWidgets.QSpinBox()
-            self.editor.setRange(-10000, 10000)
-            if defaultValue is not None:
-                self.editor.setValue(int(defaultValue))
-            self.editor.valueChanged.connect(self._emitChange)
-        elif propertyType == "token":
-            self.editor = QtWidgets.QComboBox()
-            # Add allowed token values
-            if isinstance(defaultValue, list):
-                self.editor.addItems(defaultValue)
-            elif defaultValue is not None:
-                self.editor.setCurrentText(str(defaultValue))
-            self.editor.currentTextChanged.connect(self._emitChange)
-        elif propertyType == "string":
-            self.editor = QtWidgets.QLineEdit()
-            if defaultValue is not None:
-                self.editor.setText(str(defaultValue))
-            self.editor.textChanged.connect(self._emitChange)
-        elif propertyType == "bool":
-            self.editor = QtWidgets.QCheckBox()
-            if defaultValue is not None:
-                self.editor.setChecked(bool(defaultValue))
-            self.editor.stateChanged.connect(self._emitChange)
+        if tokenValues:
+            editorParts = _makeTokenEditor(defaultValue, tokenValues)
         else:
-            self.editor = QtWidgets.QLineEdit()
-            if defaultValue is not None:
-                self.editor.setText(str(defaultValue))
-            self.editor.textChanged.connect(self._emitChange)
+            factory = _EDITOR_FACTORIES.get(propertyType, _makeStringEditor)
+            editorParts = factory(defaultValue)
+        self.editor, changedSignal, self._readEditorValue = editorParts
+        changedSignal.connect(self._emitChange)
         
         layout.addWidget(self.editor)
         
@@ -79,32 +234,26 @@ class SchemaPropertyWidget(QtWidgets.QWidget):
         self.deleteButton = QtWidgets.QPushButton("X")
         self.deleteButton.setMaximumWidth(30)
         layout.addWidget(self.deleteButton)
+        
+        self._value = self._readEditorValue()
     
+    @QtCore.Slot()
     def _emitChange(self):
-        """Emit the property changed signal"""
+        """Cache the new value and emit the property changed signal"""
+        self._value = self._readEditorValue()
         self.propertyChanged.emit()
     
     def getValue(self):
-        """Get the current value from the editor"""
-        if isinstance(self.editor, QtWidgets.QDoubleSpinBox):
-            return self.editor.value()
-        elif isinstance(self.editor, QtWidgets.QSpinBox):
-            return self.editor.value()
-        elif isinstance(self.editor, QtWidgets.QComboBox):
-            return self.editor.currentText()
-        elif isinstance(self.editor, QtWidgets.QLineEdit):
-            return self.editor.text()
-        elif isinstance(self.editor, QtWidgets.QCheckBox):
-            return self.editor.isChecked()
-        return None
+        """Get the current value of the property"""
+        return self._value
     
     def getPropertyName(self):
         """Get the property name"""
-        return self.nameLabel.text()
+        return self._propertyName
     
     def getPropertyType(self):
         """Get the property type"""
-        return self.typeLabel.text()
+        return self._propertyType
 
 
 class AddPropertyDialog(QtWidgets.QDialog):
@@ -144,6 +293,8 @@ class AddPropertyDialog(QtWidgets.QDialog):
         self.tokenValuesEdit = QtWidgets.QLineEdit()
         self.tokenValuesEdit.setPlaceholderText("Value1,Value2,Value3")
         formLayout.addRow("Allowed Token Values:", self.tokenValuesEdit)
+        self._tokenText = None
+        self._tokens = None
         
         # Documentation field
         self.docEdit = QtWidgets.QTextEdit()
@@ -160,15 +311,26 @@ class AddPropertyDialog(QtWidgets.QDialog):
         
         # Connect signals
         self.typeCombo.currentIndexChanged.connect(self._updateVisibility)
+        self.tokenValuesEdit.editingFinished.connect(self._parseTokens)
         
         # Initial visibility update
         self._updateVisibility()
     
+    @QtCore.Slot()
     def _updateVisibility(self):
         """Update field visibility based on property type"""
         isToken = self.typeCombo.currentText() == "token"
         self.tokenValuesEdit.setEnabled(isToken)
     
+    @QtCore.Slot()
+    def _parseTokens(self):
+        """Split the allowed token values once per edit"""
+        text = self.tokenValuesEdit.text()
+        if text == self._tokenText:
+            return
+        self._tokenText = text
+        self._tokens = tuple(x.strip() for x in text.split(",")) if text else None
+    
     def getPropertyData(self):
         """Get the property data entered by the user"""
         fullName = self.namespaceEdit.text() + self.nameEdit.text()
@@ -177,8 +339,10 @@ class AddPropertyDialog(QtWidgets.QDialog):
         
         # Process token values
         tokenValues = None
-        if propType == "token" and self.tokenValuesEdit.text():
-            tokenValues = [x.strip() for x in self.tokenValuesEdit.text().split(",")]
+        if propType == "token":
+            # Accepting with Enter may skip editingFinished
+            self._parseTokens()
+            tokenValues = self._tokens
         
         # Process documentation
         doc = self.docEdit.toPlainText()
@@ -192,6 +356,22 @@ class AddPropertyDialog(QtWidgets.QDialog):
         }
 
 
+class PreviewWorker(QtCore.QObject):
+    """Builds preview text on a background thread"""
+    
+    request = QtCore.Signal(object)
+    previewReady = QtCore.Signal(str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.request.connect(self._build)
+    
+    @QtCore.Slot(object)
+    def _build(self, state):
+        """Generate the preview for a state snapshot and hand it back"""
+        self.previewReady.emit(_buildPreview(state))
+
+
 class SchemaEditor(QtWidgets.QWidget):
     """Main schema editor widget"""
     
@@ -234,6 +414,7 @@ class SchemaEditor(QtWidgets.QWidget):
         parentLayout = QtWidgets.QHBoxLayout()
         parentLabel = QtWidgets.QLabel("Parent Schema:")
         self.parentCombo = QtWidgets.QComboBox()
+        self._parentItems = None
         
         parentLayout.addWidget(parentLabel)
         parentLayout.addWidget(self.parentCombo)
@@ -301,7 +482,12 @@ class SchemaEditor(QtWidgets.QWidget):
         
         self.previewText = QtWidgets.QTextEdit()
         self.previewText.setReadOnly(True)
+        self.previewText.setAcceptRichText(False)
+        self.previewText.setUndoRedoEnabled(False)
+        self.previewText.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
         self.previewText.setFont(QtGui.QFont("Courier", 10))
+        self.previewDocument = self.previewText.document()
+        self.previewDocument.setDefaultFont(QtGui.QFont("Courier", 10))
         previewLayout.addWidget(self.previewText)
         
         splitter.addWidget(previewGroupBox)
@@ -318,18 +504,41 @@ class SchemaEditor(QtWidgets.QWidget):
         
         mainLayout.addLayout(buttonLayout)
         
-        # Initialize UI
-        self._updateSchemaTypeUI()
-        self._populateParentSchemas()
+        # Coalesce bursts of edit signals into a single preview refresh
+        self._propWidgets = []
+        self._lastStateKey = None
+        self._lastPreviewHash = None
+        self._previewTimer = QtCore.QTimer(self)
+        self._previewTimer.setSingleShot(True)
+        self._previewTimer.setInterval(50)
+        self._previewTimer.timeout.connect(self._doUpdatePreview)
+        
+        # Free-form documentation only matters once the user pauses typing
+        self._docPreviewTimer = QtCore.QTimer(self)
+        self._docPreviewTimer.setSingleShot(True)
+        self._docPreviewTimer.setInterval(150)
+        self._docPreviewTimer.timeout.connect(self._doUpdatePreview)
+        
+        # Preview text is built off the UI thread; only the final
+        # document update happens here
+        self._previewThread = QtCore.QThread(self)
+        self._previewWorker = PreviewWorker()
+        self._previewWorker.moveToThread(self._previewThread)
+        self._previewWorker.previewReady.connect(self._setPreviewText)
+        self._previewThread.start()
         
         # Update preview when anything changes
         self.typeCombo.currentIndexChanged.connect(self._updatePreview)
         self.nameEdit.textChanged.connect(self._updatePreview)
         self.parentCombo.currentTextChanged.connect(self._updatePreview)
         self.libraryEdit.textChanged.connect(self._updatePreview)
-        self.docEdit.textChanged.connect(self._updatePreview)
+        self.docEdit.textChanged.connect(self._docPreviewTimer.start)
         self.namespaceEdit.textChanged.connect(self._updatePreview)
+        
+        # Initialize UI
+        self._updateSchemaTypeUI()
     
+    @QtCore.Slot()
     def _updateSchemaTypeUI(self):
         """Update UI based on selected schema type"""
         schemaType = self.typeCombo.currentIndex()
@@ -345,14 +554,24 @@ class SchemaEditor(QtWidgets.QWidget):
     
     def _populateParentSchemas(self):
         """Populate the parent schema dropdown based on schema type"""
-        self.parentCombo.clear()
-        
         schemaType = self.typeCombo.currentIndex()
         if schemaType == 0:  # Entity Schema
-            self.parentCombo.addItems(["Typed", "GeomXformable", "GeomMesh", "GeomBasisCurves"])
+            items = _ENTITY_PARENT_SCHEMAS
         else:  # API Schema
-            self.parentCombo.addItems(["APISchemaBase"])
+            items = _API_PARENT_SCHEMAS
+        
+        # Switching between the two API schema types keeps the same list
+        if items is self._parentItems:
+            return
+        self._parentItems = items
+        
+        # The caller refreshes the preview once the UI is consistent
+        self.parentCombo.blockSignals(True)
+        self.parentCombo.clear()
+        self.parentCombo.addItems(list(items))
+        self.parentCombo.blockSignals(False)
     
+    @QtCore.Slot()
     def _addProperty(self):
         """Add a new property to the schema"""
         dialog = AddPropertyDialog(self)
@@ -363,108 +582,86 @@ class SchemaEditor(QtWidgets.QWidget):
             propWidget = SchemaPropertyWidget(
                 propData["name"], 
                 propData["type"], 
-                propData["default"] if propData["default"] else None
+                propData["default"] if propData["default"] else None,
+                propData["tokenValues"]
             )
             propWidget.propertyChanged.connect(self._updatePreview)
-            propWidget.deleteButton.clicked.connect(
-                lambda: self._removeProperty(propWidget)
-            )
+            propWidget.deleteButton.clicked.connect(self._onDeleteClicked)
             
-            # Add to layout (before the stretch)
-            self.propsLayout.insertWidget(self.propsLayout.count() - 1, propWidget)
+            # Add to layout (before the stretch), repainting only once
+            self.propsWidget.setUpdatesEnabled(False)
+            try:
+                self.propsLayout.insertWidget(self.propsLayout.count() - 1, propWidget)
+                self._propWidgets.append(propWidget)
+            finally:
+                self.propsWidget.setUpdatesEnabled(True)
             
             # Update preview
             self._updatePreview()
     
+    @QtCore.Slot()
+    def _onDeleteClicked(self):
+        """Remove the property whose delete button was clicked"""
+        self._removeProperty(self.sender().parent())
+    
     def _removeProperty(self, widget):
         """Remove a property widget"""
         self.propsLayout.removeWidget(widget)
+        self._propWidgets.remove(widget)
         widget.deleteLater()
         self._updatePreview()
     
+    @QtCore.Slot()
     def _updatePreview(self):
-        """Update the USD preview text"""
-        preview = self._generateUsdPreview()
-        self.previewText.setText(preview)
+        """Schedule a preview refresh, coalescing bursts of changes"""
+        self._previewTimer.start()
+    
+    def _previewStateKey(self):
+        """Get a hashable snapshot of every input the preview depends on"""
+        return (
+            self.typeCombo.currentIndex(),
+            self.nameEdit.text(),
+            self.parentCombo.currentText(),
+            self.libraryEdit.text(),
+            self.docEdit.toPlainText(),
+            self.namespaceEdit.text(),
+            tuple(
+                (w.getPropertyName(), w.getPropertyType(), w.getValue())
+                for w in self._propWidgets
+            ),
+        )
+    
+    @QtCore.Slot()
+    def _doUpdatePreview(self):
+        """Update the USD preview text if any input changed"""
+        stateKey = self._previewStateKey()
+        if stateKey == self._lastStateKey:
+            return
+        self._lastStateKey = stateKey
+        self._previewWorker.request.emit(stateKey)
+    
+    @QtCore.Slot(str)
+    def _setPreviewText(self, preview):
+        """Show generated preview text"""
+        # Inputs that don't affect the output (e.g. the namespace of a
+        # single-apply schema) shouldn't cost a full document re-layout
+        previewHash = hash(preview)
+        if previewHash == self._lastPreviewHash:
+            return
+        self._lastPreviewHash = previewHash
+        self.previewDocument.setPlainText(preview)
+    
+    def closeEvent(self, event):
+        """Stop the preview thread before the editor goes away"""
+        self._previewThread.quit()
+        self._previewThread.wait()
+        super().closeEvent(event)
     
     def _generateUsdPreview(self):
         """Generate USD preview text"""
-        schemaType = self.typeCombo.currentIndex()
-        schemaName = self.nameEdit.text()
-        parentSchema = self.parentCombo.currentText()
-        libraryName = self.libraryEdit.text()
-        doc = self.docEdit.toPlainText()
-        
-        # Start with USDA header
-        preview = "#usda 1.0\n\n"
-        
-        # Add GLOBAL section
-        preview += 'over "GLOBAL" (\n'
-        preview += '    customData = {\n'
-        preview += f'        string libraryName = "{libraryName}"\n'
-        preview += '        string libraryPath = "./"\n'
-        preview += f'        string libraryPrefix = "{libraryName}"\n'
-        preview += '        bool skipCodeGeneration = true\n'
-        preview += '    }\n'
-        preview += ') {\n'
-        preview += '}\n\n'
-        
-        # Add schema class
-        if schemaType == 0:  # Entity Schema
-            # IsA schema
-            preview += f'class "{schemaName}" (\n'
-            preview += f'    inherits = </{parentSchema}>\n'
-            if doc:
-                preview += f'    doc = """{doc}"""\n'
-            preview += ') {\n'
-        else:  # API Schema
-            # API Schema
-            apiType = "singleApply" if schemaType == 1 else "multipleApply"
-            preview += f'class "{schemaName}API" (\n'
-            preview += f'    inherits = </{parentSchema}>\n'
-            preview += '    customData = {\n'
-            preview += f'        token apiSchemaType = "{apiType}"\n'
-            
-            # Add namespace prefix for multiple-apply API
-            if schemaType == 2:
-                namespace = self.namespaceEdit.text()
-                preview += f'        token propertyNamespacePrefix = "{namespace}"\n'
-            
-            preview += '    }\n'
-            
-            if doc:
-                preview += f'    doc = """{doc}"""\n'
-            
-            preview += ') {\n'
-        
-        # Add properties
-        for i in range(self.propsLayout.count() - 1):  # Skip the stretch item
-            widget = self.propsLayout.itemAt(i).widget()
-            if isinstance(widget, SchemaPropertyWidget):
-                propName = widget.getPropertyName()
-                propType = widget.getPropertyType()
-                propValue = widget.getValue()
-                
-                # Format property value based on type
-                valueStr = ""
-                if propType == "float":
-                    valueStr = str(propValue)
-                elif propType == "int":
-                    valueStr = str(propValue)
-                elif propType == "bool":
-                    valueStr = "true" if propValue else "false"
-                elif propType == "token":
-                    valueStr = f'"{propValue}"'
-                else:
-                    valueStr = f'"{propValue}"'
-                
-                preview += f'    {propType} {propName} = {valueStr}\n'
-        
-        # Close class
-        preview += '}\n'
-        
-        return preview
+        return _buildPreview(self._previewStateKey())
     
+    @QtCore.Slot()
     def _saveSchema(self):
         """Save the schema to a file"""
         fileName, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -475,29 +672,57 @@ class SchemaEditor(QtWidgets.QWidget):
             if not fileName.endswith(".usda"):
                 fileName += ".usda"
             
-            with open(fileName, "w") as f:
-                f.write(self._generateUsdPreview())
+            # Write section by section into a temporary file that only
+            # replaces the target once everything has been written
+            saveFile = QtCore.QSaveFile(fileName)
+            if saveFile.open(QtCore.QIODevice.WriteOnly | QtCore.QIODevice.Text):
+                for chunk in _iterUsdaChunks(self._previewStateKey()):
+                    saveFile.write(chunk.encode("utf-8"))
+            if not saveFile.commit():
+                QtWidgets.QMessageBox.warning(
+                    self, "Save Failed",
+                    f"Could not save schema to {fileName}: {saveFile.errorString()}"
+                )
+                return
             
             QtWidgets.QMessageBox.information(
                 self, "Schema Saved", f"Schema saved to {fileName}"
             )
     
+    @QtCore.Slot()
     def _clearForm(self):
         """Clear the form"""
-        self.nameEdit.clear()
-        self.docEdit.clear()
+        # Silence the inputs while resetting so only one refresh happens
+        blocked = (self.typeCombo, self.nameEdit, self.docEdit)
+        for widget in blocked:
+            widget.blockSignals(True)
+        try:
+            self.nameEdit.clear()
+            self.docEdit.clear()
+            
+            # Clear properties
+            self._removeAllProperties()
+            
+            # Reset schema type
+            self.typeCombo.setCurrentIndex(0)
+        finally:
+            for widget in blocked:
+                widget.blockSignals(False)
         
-        # Clear properties
-        for i in reversed(range(self.propsLayout.count() - 1)):  # Skip the stretch item
-            widget = self.propsLayout.itemAt(i).widget()
-            if widget:
+        # Sync the type-dependent UI and update preview
+        self._updateSchemaTypeUI()
+    
+    def _removeAllProperties(self):
+        """Remove every property widget without per-row preview refreshes"""
+        self.propsWidget.setUpdatesEnabled(False)
+        try:
+            for widget in self._propWidgets:
+                widget.blockSignals(True)
+                self.propsLayout.removeWidget(widget)
                 widget.deleteLater()
-        
-        # Reset schema type
-        self.typeCombo.setCurrentIndex(0)
-        
-        # Update preview
-        self._updatePreview()
+            self._propWidgets.clear()
+        finally:
+            self.propsWidget.setUpdatesEnabled(True)
 
 
 def main():
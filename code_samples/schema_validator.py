@@ -10,10 +10,31 @@ from pxr import Usd, UsdGeom, Sdf, Tf
 import argparse
 import sys
 import os
-import re
 import json
+import string
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, FrozenSet, NamedTuple
+
+
+# Characters allowed in namespace segments
+_LETTERS = frozenset(string.ascii_letters)
+_IDENTIFIER_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Value types resolved once instead of through Sdf.ValueTypeNames per check
+_FLOAT_TYPE = Sdf.ValueTypeNames.Float
+_EXPENSIVE_TYPES = (Sdf.ValueTypeNames.Matrix4d, Sdf.ValueTypeNames.String)
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a value read with Get() can be range-checked (bools excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# Maximum number of distinct prim fingerprints whose results are kept
+FINGERPRINT_CACHE_SIZE = 10000
 
 
 class ValidationSeverity(Enum):
@@ -23,9 +44,16 @@ class ValidationSeverity(Enum):
     INFO = 2
 
 
+# Display names indexed by ValidationSeverity value
+_SEVERITY_NAMES = ("ERROR", "WARNING", "INFO")
+
+
 class ValidationIssue:
     """Represents a single validation issue"""
     
+    # Stages can produce an issue per prim; skip the per-instance __dict__
+    __slots__ = ("path", "message", "severity", "rule_id", "fix_description")
+    
     def __init__(self, path: Sdf.Path, message: str, severity: ValidationSeverity,
                  rule_id: str, fix_description: Optional[str] = None):
         self.path = path
@@ -35,11 +63,7 @@ class ValidationIssue:
         self.fix_description = fix_description
     
     def __str__(self) -> str:
-        severity_str = {
-            ValidationSeverity.ERROR: "ERROR",
-            ValidationSeverity.WARNING: "WARNING",
-            ValidationSeverity.INFO: "INFO"
-        }[self.severity]
+        severity_str = _SEVERITY_NAMES[self.severity.value]
         
         result = f"{severity_str} [{self.rule_id}] at {self.path}: {self.message}"
         if self.fix_description:
@@ -48,14 +72,56 @@ class ValidationIssue:
         return result
 
 
+class PrimContext(NamedTuple):
+    """Per-prim data gathered once and shared by every rule"""
+    schemas: FrozenSet[str]
+    attrs: List[Usd.Attribute]
+    attrs_by_name: Dict[str, Usd.Attribute]
+    # Values of the sparkle:* attributes, read once for the fingerprint and
+    # every rule
+    values: Dict[str, Any]
+    type_name: str
+    expensive_count: int
+    
+    @classmethod
+    def from_prim(cls, prim: Usd.Prim) -> "PrimContext":
+        """Query the applied schemas and attributes of a prim"""
+        # A plain list, walked once here, so rules never go back to USD
+        attrs = list(prim.GetAttributes())
+        attrs_by_name = {}
+        values = {}
+        expensive_count = 0
+        for attr in attrs:
+            name = attr.GetName()
+            attrs_by_name[name] = attr
+            if name.startswith("sparkle:"):
+                values[name] = attr.Get()
+            if attr.GetTypeName() in _EXPENSIVE_TYPES:
+                expensive_count += 1
+        
+        return cls(
+            frozenset(prim.GetAppliedSchemas()),
+            attrs,
+            attrs_by_name,
+            values,
+            str(prim.GetTypeName()),
+            expensive_count
+        )
+
+
 class ValidationRule:
     """Base class for validation rules"""
     
+    # Whether the rule can report issues on prims with no applied schemas
+    # and no sparkle:* attributes (scopes, groups, plain geometry)
+    checks_plain_prims = False
+    
     def __init__(self, rule_id: str, description: str):
         self.rule_id = rule_id
         self.description = description
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         """Validate a prim against this rule"""
         raise NotImplementedError("Subclasses must implement validate method")
 
@@ -68,23 +134,29 @@ class NamespaceValidationRule(ValidationRule):
             "SCHEMA_NAMESPACE_001",
             "Property names should follow the namespace convention 'sparkle:category:name'"
         )
-        
-        # Regex pattern for valid namespaced attributes
-        self.namespace_pattern = re.compile(r'^sparkle:[a-zA-Z]+:[a-zA-Z][a-zA-Z0-9_]*$')
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    @staticmethod
+    def _is_valid_namespace(name: str) -> bool:
+        """Check a name against 'sparkle:category:name' without a regex"""
+        parts = name.split(":", 2)
+        if len(parts) != 3 or parts[0] != "sparkle":
+            return False
+        category, leaf = parts[1], parts[2]
+        return (bool(category) and _LETTERS.issuperset(category)
+                and leaf[:1] in _LETTERS and _IDENTIFIER_CHARS.issuperset(leaf))
+    
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
         # Only check attributes where namespace should be enforced
-        for attr in prim.GetAttributes():
-            name = attr.GetName()
-            
+        for name in ctx.attrs_by_name:
             # Skip non-sparkle attributes
             if not name.startswith("sparkle:"):
                 continue
             
             # Check namespace pattern
-            if not self.namespace_pattern.match(name):
+            if not self._is_valid_namespace(name):
                 issues.append(ValidationIssue(
                     prim.GetPath(),
                     f"Attribute '{name}' does not follow namespace convention",
@@ -99,30 +171,31 @@ class NamespaceValidationRule(ValidationRule):
 class HealthComponentValidationRule(ValidationRule):
     """Rule for validating the health component"""
     
+    _REQUIRED_ATTRS = {
+        "sparkle:health:current": {"type": _FLOAT_TYPE, "min": 0.0},
+        "sparkle:health:maximum": {"type": _FLOAT_TYPE, "min": 0.0},
+    }
+    
     def __init__(self):
         super().__init__(
             "HEALTH_COMP_001",
             "Health component should have required attributes with valid values"
         )
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
         # Check if prim has the health API schema
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
-        
-        if "SparkleHealthAPI" not in schemas:
+        if "SparkleHealthAPI" not in ctx.schemas:
             return issues  # Not applicable
         
-        # Check required attributes
-        required_attrs = {
-            "sparkle:health:current": {"type": Sdf.ValueTypeNames.Float, "min": 0.0},
-            "sparkle:health:maximum": {"type": Sdf.ValueTypeNames.Float, "min": 0.0},
-        }
+        # Each attribute value is read once and reused by the checks below
+        values = {}
         
-        for attr_name, requirements in required_attrs.items():
-            attr = prim.GetAttribute(attr_name)
+        # Check required attributes
+        for attr_name, requirements in self._REQUIRED_ATTRS.items():
+            attr = ctx.attrs_by_name.get(attr_name)
             
             # Check attribute existence
             if not attr:
@@ -145,10 +218,16 @@ class HealthComponentValidationRule(ValidationRule):
                     f"Change attribute type to '{requirements['type']}'"
                 ))
             
+            # Get() returns a value of whatever type was authored; only
+            # numbers are range-checked and compared below
+            value = ctx.values[attr_name]
+            if not _is_number(value):
+                continue
+            values[attr_name] = value
+            
             # Check value constraints
             if "min" in requirements:
-                value = 0.0
-                if attr.Get(&value) and value < requirements["min"]:
+                if value < requirements["min"]:
                     issues.append(ValidationIssue(
                         prim.GetPath(),
                         f"Attribute '{attr_name}' value {value} is less than minimum {requirements['min']}",
@@ -158,22 +237,18 @@ class HealthComponentValidationRule(ValidationRule):
                     ))
         
         # Check value relationships
-        current_health = prim.GetAttribute("sparkle:health:current")
-        max_health = prim.GetAttribute("sparkle:health:maximum")
+        current_value = values.get("sparkle:health:current")
+        max_value = values.get("sparkle:health:maximum")
         
-        if current_health and max_health:
-            current_value = 0.0
-            max_value = 0.0
-            
-            if current_health.Get(&current_value) and max_health.Get(&max_value):
-                if current_value > max_value:
-                    issues.append(ValidationIssue(
-                        prim.GetPath(),
-                        f"Current health ({current_value}) exceeds maximum health ({max_value})",
-                        ValidationSeverity.ERROR,
-                        self.rule_id,
-                        f"Reduce current health to be less than or equal to maximum health"
-                    ))
+        if current_value is not None and max_value is not None:
+            if current_value > max_value:
+                issues.append(ValidationIssue(
+                    prim.GetPath(),
+                    f"Current health ({current_value}) exceeds maximum health ({max_value})",
+                    ValidationSeverity.ERROR,
+                    self.rule_id,
+                    f"Reduce current health to be less than or equal to maximum health"
+                ))
         
         return issues
 
@@ -181,24 +256,25 @@ class HealthComponentValidationRule(ValidationRule):
 class MovementComponentValidationRule(ValidationRule):
     """Rule for validating the movement component"""
     
+    _ALLOWED_PATTERNS_ORDER = ("direct", "patrol", "wander", "charge", "flee", "stationary")
+    _ALLOWED_PATTERNS = frozenset(_ALLOWED_PATTERNS_ORDER)
+    
     def __init__(self):
         super().__init__(
             "MOVEMENT_COMP_001",
             "Movement component should have valid pattern and speed values"
         )
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
         # Check if prim has the movement API schema
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
-        
-        if "SparkleMovementAPI" not in schemas:
+        if "SparkleMovementAPI" not in ctx.schemas:
             return issues  # Not applicable
         
         # Check speed attribute
-        speed_attr = prim.GetAttribute("sparkle:movement:speed")
+        speed_attr = ctx.attrs_by_name.get("sparkle:movement:speed")
         if not speed_attr:
             issues.append(ValidationIssue(
                 prim.GetPath(),
@@ -209,8 +285,8 @@ class MovementComponentValidationRule(ValidationRule):
             ))
         else:
             # Check speed value
-            speed = 0.0
-            if speed_attr.Get(&speed):
+            speed = ctx.values["sparkle:movement:speed"]
+            if _is_number(speed):
                 if speed < 0.0:
                     issues.append(ValidationIssue(
                         prim.GetPath(),
@@ -229,7 +305,7 @@ class MovementComponentValidationRule(ValidationRule):
                     ))
         
         # Check pattern attribute
-        pattern_attr = prim.GetAttribute("sparkle:movement:pattern")
+        pattern_attr = ctx.attrs_by_name.get("sparkle:movement:pattern")
         if not pattern_attr:
             issues.append(ValidationIssue(
                 prim.GetPath(),
@@ -240,17 +316,16 @@ class MovementComponentValidationRule(ValidationRule):
             ))
         else:
             # Check pattern value
-            pattern = Tf.Token()
-            if pattern_attr.Get(&pattern):
-                allowed_patterns = ["direct", "patrol", "wander", "charge", "flee", "stationary"]
-                if pattern.GetString() not in allowed_patterns:
-                    issues.append(ValidationIssue(
-                        prim.GetPath(),
-                        f"Movement pattern '{pattern}' is not one of the allowed values: {', '.join(allowed_patterns)}",
-                        ValidationSeverity.ERROR,
-                        self.rule_id,
-                        f"Set pattern to one of: {', '.join(allowed_patterns)}"
-                    ))
+            pattern = ctx.values["sparkle:movement:pattern"]
+            if pattern is not None and str(pattern) not in self._ALLOWED_PATTERNS:
+                allowed_patterns = ', '.join(self._ALLOWED_PATTERNS_ORDER)
+                issues.append(ValidationIssue(
+                    prim.GetPath(),
+                    f"Movement pattern '{pattern}' is not one of the allowed values: {allowed_patterns}",
+                    ValidationSeverity.ERROR,
+                    self.rule_id,
+                    f"Set pattern to one of: {allowed_patterns}"
+                ))
         
         return issues
 
@@ -258,24 +333,25 @@ class MovementComponentValidationRule(ValidationRule):
 class AiComponentValidationRule(ValidationRule):
     """Rule for validating the AI component"""
     
+    _ALLOWED_BEHAVIORS_ORDER = ("passive", "defensive", "aggressive", "neutral", "flee")
+    _ALLOWED_BEHAVIORS = frozenset(_ALLOWED_BEHAVIORS_ORDER)
+    
     def __init__(self):
         super().__init__(
             "AI_COMP_001",
             "AI component should have valid behavior values and consistent configuration"
         )
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
         # Check if prim has the AI API schema
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
-        
-        if "SparkleAIAPI" not in schemas:
+        if "SparkleAIAPI" not in ctx.schemas:
             return issues  # Not applicable
         
         # Check behavior attribute
-        behavior_attr = prim.GetAttribute("sparkle:ai:behavior")
+        behavior_attr = ctx.attrs_by_name.get("sparkle:ai:behavior")
         if not behavior_attr:
             issues.append(ValidationIssue(
                 prim.GetPath(),
@@ -286,23 +362,22 @@ class AiComponentValidationRule(ValidationRule):
             ))
         else:
             # Check behavior value
-            behavior = Tf.Token()
-            if behavior_attr.Get(&behavior):
-                allowed_behaviors = ["passive", "defensive", "aggressive", "neutral", "flee"]
-                if behavior.GetString() not in allowed_behaviors:
-                    issues.append(ValidationIssue(
-                        prim.GetPath(),
-                        f"AI behavior '{behavior}' is not one of the allowed values: {', '.join(allowed_behaviors)}",
-                        ValidationSeverity.ERROR,
-                        self.rule_id,
-                        f"Set behavior to one of: {', '.join(allowed_behaviors)}"
-                    ))
+            behavior = ctx.values["sparkle:ai:behavior"]
+            if behavior is not None and str(behavior) not in self._ALLOWED_BEHAVIORS:
+                allowed_behaviors = ', '.join(self._ALLOWED_BEHAVIORS_ORDER)
+                issues.append(ValidationIssue(
+                    prim.GetPath(),
+                    f"AI behavior '{behavior}' is not one of the allowed values: {allowed_behaviors}",
+                    ValidationSeverity.ERROR,
+                    self.rule_id,
+                    f"Set behavior to one of: {allowed_behaviors}"
+                ))
         
         # Check detection radius attribute
-        radius_attr = prim.GetAttribute("sparkle:ai:detectionRadius")
+        radius_attr = ctx.attrs_by_name.get("sparkle:ai:detectionRadius")
         if radius_attr:
-            radius = 0.0
-            if radius_attr.Get(&radius) and radius < 0.0:
+            radius = ctx.values["sparkle:ai:detectionRadius"]
+            if _is_number(radius) and radius < 0.0:
                 issues.append(ValidationIssue(
                     prim.GetPath(),
                     f"AI detection radius ({radius}) cannot be negative",
@@ -312,13 +387,12 @@ class AiComponentValidationRule(ValidationRule):
                 ))
         
         # Check for patrol path consistency
-        patrol_path_rel = prim.GetRelationship("sparkle:ai:patrolPath")
-        if patrol_path_rel:
+        if prim.HasRelationship("sparkle:ai:patrolPath"):
             # If has patrol path, movement pattern should be "patrol"
-            movement_pattern_attr = prim.GetAttribute("sparkle:movement:pattern")
+            movement_pattern_attr = ctx.attrs_by_name.get("sparkle:movement:pattern")
             if movement_pattern_attr:
-                pattern = Tf.Token()
-                if movement_pattern_attr.Get(&pattern) and pattern.GetString() != "patrol":
+                pattern = ctx.values["sparkle:movement:pattern"]
+                if pattern is not None and str(pattern) != "patrol":
                     issues.append(ValidationIssue(
                         prim.GetPath(),
                         f"AI has patrol path but movement pattern is '{pattern}' instead of 'patrol'",
@@ -333,18 +407,20 @@ class AiComponentValidationRule(ValidationRule):
 class PerformanceValidationRule(ValidationRule):
     """Rule for validating performance aspects of schemas"""
     
+    checks_plain_prims = True
+    
     def __init__(self):
         super().__init__(
             "PERF_001",
             "Schema usage should follow performance best practices"
         )
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
         # Check applied API schemas count
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
+        schemas = ctx.schemas
         
         if len(schemas) > 10:
             issues.append(ValidationIssue(
@@ -356,7 +432,7 @@ class PerformanceValidationRule(ValidationRule):
             ))
         
         # Check attribute count
-        attrs = prim.GetAttributes()
+        attrs = ctx.attrs
         if len(attrs) > 50:
             issues.append(ValidationIssue(
                 prim.GetPath(),
@@ -367,10 +443,7 @@ class PerformanceValidationRule(ValidationRule):
             ))
         
         # Check for expensive data types
-        expensive_count = 0
-        for attr in attrs:
-            if attr.GetTypeName() in [Sdf.ValueTypeNames.Matrix4d, Sdf.ValueTypeNames.String]:
-                expensive_count += 1
+        expensive_count = ctx.expensive_count
         
         if expensive_count > 10:
             issues.append(ValidationIssue(
@@ -387,73 +460,92 @@ class PerformanceValidationRule(ValidationRule):
 class EntityTypeValidationRule(ValidationRule):
     """Rule for validating entity type usage"""
     
+    checks_plain_prims = True
+    
+    # Recommended API schemas per entity type
+    _ENEMY_SCHEMAS_ORDER = ("SparkleHealthAPI", "SparkleCombatAPI", "SparkleAIAPI")
+    _ENEMY_SCHEMAS = frozenset(_ENEMY_SCHEMAS_ORDER)
+    _PLAYER_SCHEMAS_ORDER = ("SparkleHealthAPI", "SparkleMovementAPI")
+    _PLAYER_SCHEMAS = frozenset(_PLAYER_SCHEMAS_ORDER)
+    
     def __init__(self):
         super().__init__(
             "ENTITY_TYPE_001",
             "Entity types should have appropriate API schemas"
         )
+        
+        # Resolve entity types once rather than per prim
+        self._validators_by_typename = {
+            "SparkleEnemyCarrot": self._validate_enemy,
+            "SparklePlayer": self._validate_player,
+            "SparklePickup": self._validate_pickup,
+        }
+        self._validators_by_type = [
+            (Tf.Type.FindByName(type_name), validator)
+            for type_name, validator in self._validators_by_typename.items()
+        ]
     
-    def validate(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
+    def validate(self, stage: Usd.Stage, prim: Usd.Prim,
+                 ctx: PrimContext) -> List[ValidationIssue]:
         issues = []
         
-        # Check specific entity types
-        if prim.IsA(Tf.Type.FindByName("SparkleEnemyCarrot")):
-            return self._validate_enemy(prim)
-        elif prim.IsA(Tf.Type.FindByName("SparklePlayer")):
-            return self._validate_player(prim)
-        elif prim.IsA(Tf.Type.FindByName("SparklePickup")):
-            return self._validate_pickup(prim)
+        # Concrete entity types match by name
+        validator = self._validators_by_typename.get(ctx.type_name)
+        if validator is not None:
+            return validator(prim, ctx)
+        
+        # Types derived from an entity type need an IsA check
+        if ctx.type_name:
+            for entity_type, validator in self._validators_by_type:
+                if prim.IsA(entity_type):
+                    return validator(prim, ctx)
         
         return issues
     
-    def _validate_enemy(self, prim: Usd.Prim) -> List[ValidationIssue]:
+    def _validate_enemy(self, prim: Usd.Prim, ctx: PrimContext) -> List[ValidationIssue]:
         """Validate enemy entity type"""
         issues = []
         
         # Enemies should have health, combat, and AI
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
+        missing = self._ENEMY_SCHEMAS.difference(ctx.schemas)
         
-        expected_schemas = ["SparkleHealthAPI", "SparkleCombatAPI", "SparkleAIAPI"]
-        for schema in expected_schemas:
-            if schema not in schemas:
-                issues.append(ValidationIssue(
-                    prim.GetPath(),
-                    f"Enemy is missing recommended schema: {schema}",
-                    ValidationSeverity.WARNING,
-                    self.rule_id,
-                    f"Apply {schema} to this enemy entity"
-                ))
+        # Report in declaration order so output stays stable
+        for schema in sorted(missing, key=self._ENEMY_SCHEMAS_ORDER.index):
+            issues.append(ValidationIssue(
+                prim.GetPath(),
+                f"Enemy is missing recommended schema: {schema}",
+                ValidationSeverity.WARNING,
+                self.rule_id,
+                f"Apply {schema} to this enemy entity"
+            ))
         
         return issues
     
-    def _validate_player(self, prim: Usd.Prim) -> List[ValidationIssue]:
+    def _validate_player(self, prim: Usd.Prim, ctx: PrimContext) -> List[ValidationIssue]:
         """Validate player entity type"""
         issues = []
         
         # Players should have health and movement
-        schemas = []
-        prim.GetAppliedSchemas(schemas)
+        missing = self._PLAYER_SCHEMAS.difference(ctx.schemas)
         
-        expected_schemas = ["SparkleHealthAPI", "SparkleMovementAPI"]
-        for schema in expected_schemas:
-            if schema not in schemas:
-                issues.append(ValidationIssue(
-                    prim.GetPath(),
-                    f"Player is missing recommended schema: {schema}",
-                    ValidationSeverity.WARNING,
-                    self.rule_id,
-                    f"Apply {schema} to this player entity"
-                ))
+        # Report in declaration order so output stays stable
+        for schema in sorted(missing, key=self._PLAYER_SCHEMAS_ORDER.index):
+            issues.append(ValidationIssue(
+                prim.GetPath(),
+                f"Player is missing recommended schema: {schema}",
+                ValidationSeverity.WARNING,
+                self.rule_id,
+                f"Apply {schema} to this player entity"
+            ))
         
         return issues
     
-    def _validate_pickup(self, prim: Usd.Prim) -> List[ValidationIssue]:
+    def _validate_pickup(self, prim: Usd.Prim, ctx: PrimContext) -> List[ValidationIssue]:
         """Validate pickup entity type"""
         issues = []
         
         # Check for required pickup ID
-        id_attr = prim.GetAttribute("sparkle:entity:id")
+        id_attr = ctx.attrs_by_name.get("sparkle:entity:id")
         if not id_attr:
             issues.append(ValidationIssue(
                 prim.GetPath(),
@@ -469,7 +561,7 @@ class EntityTypeValidationRule(ValidationRule):
 class SchemaValidator:
     """Main schema validator class"""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         # Initialize rules
         self.rules = [
             NamespaceValidationRule(),
@@ -480,86 +572,186 @@ class SchemaValidator:
             EntityTypeValidationRule()
         ]
         
+        self._plain_prim_rules = [rule for rule in self.rules if rule.checks_plain_prims]
+        
+        # Worker threads used to validate prims; None uses the CPU count
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        # Issue templates for previously seen prim fingerprints, so prims
+        # that only differ by path (e.g. spawned instances) skip the rules
+        self._fingerprint_cache = OrderedDict()
+        self._fingerprint_cache_lock = threading.Lock()
+        
         # Initialize issue trackers
         self.all_issues = []
-        self.issue_counts = {
-            ValidationSeverity.ERROR: 0,
-            ValidationSeverity.WARNING: 0,
-            ValidationSeverity.INFO: 0
-        }
+        self.error_count = 0
+        self.warning_count = 0
+        self.info_count = 0
     
     def validate_stage(self, stage: Usd.Stage) -> List[ValidationIssue]:
         """Validate all prims in a stage"""
         self.all_issues = []
-        self.issue_counts = {
-            ValidationSeverity.ERROR: 0,
-            ValidationSeverity.WARNING: 0,
-            ValidationSeverity.INFO: 0
-        }
+        self.error_count = 0
+        self.warning_count = 0
+        self.info_count = 0
+        
+        prims = [prim for prim in stage.Traverse()
+                 if prim.IsValid() and not prim.IsAbstract()]
+        
+        # Prims are independent and rules are stateless, so validate them
+        # concurrently; map() keeps results in traversal order
+        if self.max_workers > 1 and len(prims) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    lambda prim: self._validate_prim(stage, prim), prims
+                ))
+        else:
+            results = [self._validate_prim(stage, prim) for prim in prims]
         
-        # Validate each prim
-        for prim in stage.Traverse():
-            if prim.IsValid() and not prim.IsAbstract():
-                self._validate_prim(stage, prim)
+        # Merge per-prim results on this thread
+        for issues in results:
+            self._record_issues(issues)
         
         return self.all_issues
     
-    def _validate_prim(self, stage: Usd.Stage, prim: Usd.Prim):
+    def _validate_prim(self, stage: Usd.Stage, prim: Usd.Prim) -> List[ValidationIssue]:
         """Validate a single prim against all rules"""
+        ctx = PrimContext.from_prim(prim)
+        
+        # Most prims in a stage are structural; only run the rules that can
+        # apply to them
+        if not ctx.schemas and not ctx.values:
+            issues = []
+            for rule in self._plain_prim_rules:
+                issues.extend(rule.validate(stage, prim, ctx))
+            return issues
+        
+        fingerprint = self._fingerprint(prim, ctx)
+        
+        if fingerprint is not None:
+            with self._fingerprint_cache_lock:
+                templates = self._fingerprint_cache.get(fingerprint)
+                if templates is not None:
+                    self._fingerprint_cache.move_to_end(fingerprint)
+            if templates is not None:
+                path = prim.GetPath()
+                return [ValidationIssue(path, *template) for template in templates]
+        
+        issues = []
         for rule in self.rules:
-            issues = rule.validate(stage, prim)
+            issues.extend(rule.validate(stage, prim, ctx))
+        
+        if fingerprint is not None:
+            templates = [
+                (issue.message, issue.severity, issue.rule_id, issue.fix_description)
+                for issue in issues
+            ]
+            with self._fingerprint_cache_lock:
+                self._fingerprint_cache[fingerprint] = templates
+                if len(self._fingerprint_cache) > FINGERPRINT_CACHE_SIZE:
+                    self._fingerprint_cache.popitem(last=False)
+        
+        return issues
+    
+    def _fingerprint(self, prim: Usd.Prim, ctx: PrimContext) -> Optional[tuple]:
+        """Get a key covering everything the rules inspect, or None if unhashable"""
+        attrs_by_name = ctx.attrs_by_name
+        sparkle_attrs = tuple(
+            (name, str(attrs_by_name[name].GetTypeName()), value)
+            for name, value in sorted(ctx.values.items())
+        )
+        fingerprint = (
+            ctx.type_name,
+            ctx.schemas,
+            len(ctx.attrs),
+            ctx.expensive_count,
+            prim.HasRelationship("sparkle:ai:patrolPath"),
+            sparkle_attrs
+        )
+        
+        # Array-valued attributes can't be used as a key
+        try:
+            hash(fingerprint)
+        except TypeError:
+            return None
+        return fingerprint
+    
+    def _record_issues(self, issues: List[ValidationIssue]):
+        """Add a prim's issues to the results"""
+        if issues:
+            self.all_issues.extend(issues)
             
-            if issues:
-                self.all_issues.extend(issues)
-                
-                # Update issue counts
-                for issue in issues:
-                    self.issue_counts[issue.severity] += 1
+            # Update issue counts
+            for issue in issues:
+                severity = issue.severity
+                if severity is ValidationSeverity.ERROR:
+                    self.error_count += 1
+                elif severity is ValidationSeverity.WARNING:
+                    self.warning_count += 1
+                else:
+                    self.info_count += 1
+    
+    @property
+    def issue_counts(self) -> Dict[ValidationSeverity, int]:
+        """Issue counts keyed by severity"""
+        return {
+            ValidationSeverity.ERROR: self.error_count,
+            ValidationSeverity.WARNING: self.warning_count,
+            ValidationSeverity.INFO: self.info_count
+        }
     
     def get_summary(self) -> str:
         """Get a summary of validation results"""
         return (
             f"Validation complete: "
-            f"{self.issue_counts[ValidationSeverity.ERROR]} errors, "
-            f"{self.issue_counts[ValidationSeverity.WARNING]} warnings, "
-            f"{self.issue_counts[ValidationSeverity.INFO]} info"
+            f"{self.error_count} errors, "
+            f"{self.warning_count} warnings, "
+            f"{self.info_count} info"
         )
     
     def print_issues(self, severity_filter: Optional[ValidationSeverity] = None):
         """Print all validation issues, optionally filtered by severity"""
-        for issue in self.all_issues:
-            if severity_filter is None or issue.severity == severity_filter:
-                print(issue)
+        issues = self.all_issues
+        if severity_filter is not None:
+            issues = [issue for issue in issues if issue.severity is severity_filter]
+        
+        # One write for the whole listing instead of a print per issue
+        if issues:
+            sys.stdout.write("\n".join(map(str, issues)) + "\n")
     
     def has_errors(self) -> bool:
         """Check if validation found any errors"""
-        return self.issue_counts[ValidationSeverity.ERROR] > 0
+        return self.error_count > 0
     
     def generate_report(self, output_path: str):
         """Generate a detailed validation report"""
-        report = {
-            "summary": {
-                "errors": self.issue_counts[ValidationSeverity.ERROR],
-                "warnings": self.issue_counts[ValidationSeverity.WARNING],
-                "info": self.issue_counts[ValidationSeverity.INFO],
-                "total": len(self.all_issues)
-            },
-            "issues": []
+        summary = {
+            "errors": self.error_count,
+            "warnings": self.warning_count,
+            "info": self.info_count,
+            "total": len(self.all_issues)
         }
         
-        # Add issues to report
-        for issue in self.all_issues:
-            report["issues"].append({
-                "path": str(issue.path),
-                "message": issue.message,
-                "severity": str(issue.severity.name),
-                "rule_id": issue.rule_id,
-                "fix_description": issue.fix_description
-            })
-        
-        # Write report
+        # Write issues one compact record per line rather than building
+        # the whole report in memory first
         with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+            f.write('{"summary": ')
+            f.write(json.dumps(summary))
+            f.write(', "issues": [')
+            
+            separator = "\n"
+            for issue in self.all_issues:
+                f.write(separator)
+                f.write(json.dumps({
+                    "path": str(issue.path),
+                    "message": issue.message,
+                    "severity": str(issue.severity.name),
+                    "rule_id": issue.rule_id,
+                    "fix_description": issue.fix_description
+                }, separators=(",", ":")))
+                separator = ",\n"
+            
+            f.write("\n]}\n")
 
 
 def main():
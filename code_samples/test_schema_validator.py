@@ -0,0 +1,72 @@
+"""
+Tests for schema_validator.py
+"""
+
+import pytest
+
+Usd = pytest.importorskip("pxr.Usd")
+from pxr import Sdf
+
+from schema_validator import (
+    AiComponentValidationRule,
+    HealthComponentValidationRule,
+    MovementComponentValidationRule,
+    PrimContext,
+    ValidationSeverity,
+)
+
+
+def _prim_context(schema, attrs):
+    """A prim with the given (name, type, value) attributes, seen as having schema applied"""
+    stage = Usd.Stage.CreateInMemory()
+    prim = stage.DefinePrim("/Enemy", "Xform")
+    for name, value_type, value in attrs:
+        prim.CreateAttribute(name, value_type).Set(value)
+    ctx = PrimContext.from_prim(prim)._replace(schemas=frozenset({schema}))
+    return stage, prim, ctx
+
+
+def _health_prim_context(current_type, current_value):
+    """A prim with health attributes, seen as having SparkleHealthAPI applied"""
+    return _prim_context("SparkleHealthAPI", (
+        ("sparkle:health:current", current_type, current_value),
+        ("sparkle:health:maximum", Sdf.ValueTypeNames.Float, 100.0),
+    ))
+
+
+def test_health_string_current_reports_type_without_raising():
+    stage, prim, ctx = _health_prim_context(Sdf.ValueTypeNames.String, "full")
+    
+    issues = HealthComponentValidationRule().validate(stage, prim, ctx)
+    
+    assert len(issues) == 1
+    assert issues[0].severity is ValidationSeverity.ERROR
+    assert "incorrect type" in issues[0].message
+
+
+def test_health_current_above_maximum():
+    stage, prim, ctx = _health_prim_context(Sdf.ValueTypeNames.Float, 150.0)
+    
+    issues = HealthComponentValidationRule().validate(stage, prim, ctx)
+    
+    assert [issue.message for issue in issues] == [
+        "Current health (150.0) exceeds maximum health (100.0)"
+    ]
+
+
+def test_movement_string_speed_is_not_range_checked():
+    stage, prim, ctx = _prim_context("SparkleMovementAPI", (
+        ("sparkle:movement:speed", Sdf.ValueTypeNames.String, "fast"),
+        ("sparkle:movement:pattern", Sdf.ValueTypeNames.Token, "patrol"),
+    ))
+    
+    assert MovementComponentValidationRule().validate(stage, prim, ctx) == []
+
+
+def test_ai_string_detection_radius_is_not_range_checked():
+    stage, prim, ctx = _prim_context("SparkleAIAPI", (
+        ("sparkle:ai:behavior", Sdf.ValueTypeNames.Token, "passive"),
+        ("sparkle:ai:detectionRadius", Sdf.ValueTypeNames.String, "far"),
+    ))
+    
+    assert AiComponentValidationRule().validate(stage, prim, ctx) == []
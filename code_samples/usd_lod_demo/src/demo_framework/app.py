@@ -8,6 +8,7 @@ Provides the base application structure for all demos, handling:
 - Integration with USD stage
 """
 
+import importlib
 import os
 import sys
 from pathlib import Path
@@ -19,6 +20,9 @@ import pyray as rl
 from .renderer import Renderer
 from .ui import UI
 
+# Seconds between refreshes of the debug overlay text
+DEBUG_TEXT_INTERVAL = 0.1
+
 # Base class for all demos
 class Demo:
     """Base class for all demos"""
@@ -58,10 +62,16 @@ class DemoApplication:
         self.width = width
         self.height = height
         self.running = False
-        self.demos: Dict[str, Type[Demo]] = {}
+        # Demo classes by name; a "module.Class" path is imported the first
+        # time its demo is selected
+        self.demos: Dict[str, Union[Type[Demo], str]] = {}
         self.current_demo: Optional[Demo] = None
         self.current_demo_name: Optional[str] = None
         
+        # Demo selection panel layout, rebuilt only when demos are registered
+        self._demo_buttons: List[Tuple[str, int, int, int, int]] = []
+        self._demo_panel_height = 30
+        
         # Assets path
         self.assets_path = Path(__file__).parent.parent.parent / "assets"
         
@@ -78,12 +88,20 @@ class DemoApplication:
         self.camera.fovy = 60.0
         self.camera.projection = rl.CAMERA_PERSPECTIVE
         
+        # Debug text is refreshed at a fixed rate rather than every frame
+        self._debug_text_elapsed = 0.0
+        self._debug_text = self._format_debug_text()
+        
         # Initialize renderer and UI
         self.renderer = Renderer(self)
         self.ui = UI(self)
         
-    def register_demo(self, name: str, demo_class: Type[Demo]):
-        """Register a demo with the application"""
+    def register_demo(self, name: str, demo_class: Union[Type[Demo], str]):
+        """Register a demo class, or its "module.Class" path to import on selection"""
+        if name not in self.demos:
+            y = 40 + len(self._demo_buttons) * 30
+            self._demo_buttons.append((name, 10, y, 180, 25))
+            self._demo_panel_height = 30 + len(self._demo_buttons) * 30
         self.demos[name] = demo_class
         
     def select_demo(self, name: str):
@@ -98,6 +116,10 @@ class DemoApplication:
             
         # Create and initialize new demo
         demo_class = self.demos[name]
+        if isinstance(demo_class, str):
+            module_name, _, class_name = demo_class.rpartition(".")
+            demo_class = getattr(importlib.import_module(module_name), class_name)
+            self.demos[name] = demo_class
         self.current_demo = demo_class(self)
         self.current_demo_name = name
         
@@ -109,8 +131,8 @@ class DemoApplication:
         self.running = True
         
         # Select first demo if available
-        if self.demos and not self.current_demo:
-            first_demo_name = next(iter(self.demos))
+        if self._demo_buttons and not self.current_demo:
+            first_demo_name = self._demo_buttons[0][0]
             self.select_demo(first_demo_name)
         
         # Main loop
@@ -125,8 +147,11 @@ class DemoApplication:
             
             # 3D scene
             rl.begin_mode_3d(self.camera)
+            self.renderer.begin_frame()
             self._render_3d()
+            self.renderer.flush()
             rl.end_mode_3d()
+            self.renderer.flush_labels()
             
             # 2D UI
             self._render_ui()
@@ -137,6 +162,8 @@ class DemoApplication:
         if self.current_demo:
             self.current_demo.cleanup()
             
+        self.renderer.unload()
+        self.ui.unload()
         rl.close_window()
         
     def _update(self, delta_time: float):
@@ -144,6 +171,12 @@ class DemoApplication:
         # Update camera
         self._update_camera(delta_time)
         
+        # Refresh debug text
+        self._debug_text_elapsed += delta_time
+        if self._debug_text_elapsed >= DEBUG_TEXT_INTERVAL:
+            self._debug_text = self._format_debug_text()
+            self._debug_text_elapsed = 0.0
+        
         # Update UI
         self.ui.update(delta_time)
         
@@ -156,21 +189,16 @@ class DemoApplication:
         # Camera controls: WASD for movement, mouse for look
         speed = 10.0 * delta_time
         
-        # Forward/backward
-        if rl.is_key_down(rl.KEY_W):
-            self.camera.position.z -= speed
-            self.camera.target.z -= speed
-        if rl.is_key_down(rl.KEY_S):
-            self.camera.position.z += speed
-            self.camera.target.z += speed
-            
-        # Left/right
-        if rl.is_key_down(rl.KEY_A):
-            self.camera.position.x -= speed
-            self.camera.target.x -= speed
-        if rl.is_key_down(rl.KEY_D):
-            self.camera.position.x += speed
-            self.camera.target.x += speed
+        # Opposing keys cancel out: right/left and backward/forward
+        dx = (rl.is_key_down(rl.KEY_D) - rl.is_key_down(rl.KEY_A)) * speed
+        dz = (rl.is_key_down(rl.KEY_S) - rl.is_key_down(rl.KEY_W)) * speed
+        
+        # Write each vector once instead of per-component struct updates
+        if dx or dz:
+            position = self.camera.position
+            target = self.camera.target
+            self.camera.position = rl.Vector3(position.x + dx, position.y, position.z + dz)
+            self.camera.target = rl.Vector3(target.x + dx, target.y, target.z + dz)
             
         # Mouse look (when right button is held)
         if rl.is_mouse_button_down(rl.MOUSE_BUTTON_RIGHT):
@@ -198,19 +226,19 @@ class DemoApplication:
         if self.current_demo:
             self.current_demo.render_ui()
             
-        # Draw debug info
-        self._render_debug_info()
-        
         # End UI rendering
         self.ui.end_frame()
         
+        # Draw debug info after the deferred UI layers so it stays on top
+        self._render_debug_info()
+        
     def _render_demo_selection(self):
         """Render demo selection UI"""
-        self.ui.begin_panel("Demos", 10, 10, 200, 30 + len(self.demos) * 30)
+        self.ui.begin_panel("Demos", 10, 10, 200, self._demo_panel_height)
         
-        for i, demo_name in enumerate(self.demos.keys()):
-            is_selected = demo_name == self.current_demo_name
-            if self.ui.button(demo_name, 10, 40 + i * 30, 180, 25, is_selected):
+        current_demo_name = self.current_demo_name
+        for demo_name, x, y, w, h in self._demo_buttons:
+            if self.ui.button(demo_name, x, y, w, h, demo_name == current_demo_name):
                 self.select_demo(demo_name)
                 
         self.ui.end_panel()
@@ -220,5 +248,9 @@ class DemoApplication:
         rl.draw_fps(self.width - 100, 10)
         
         # Camera position
-        pos_text = f"Pos: ({self.camera.position.x:.1f}, {self.camera.position.y:.1f}, {self.camera.position.z:.1f})"
-        rl.draw_text(pos_text, 10, self.height - 30, 20, rl.Color(50, 50, 50, 255))
\ No newline at end of file
+        rl.draw_text(self._debug_text, 10, self.height - 30, 20, rl.Color(50, 50, 50, 255))
+        
+    def _format_debug_text(self) -> str:
+        """Format the camera position debug text"""
+        position = self.camera.position
+        return f"Pos: ({position.x:.1f}, {position.y:.1f}, {position.z:.1f})"
\ No newline at end of file
@@ -5,13 +5,103 @@ Provides abstraction for rendering USD scenes using Raylib.
 Simplifies the representation of USD elements for visualization.
 """
 
+import numpy as np
 import pyray as rl
-from typing import List, Dict, Tuple, Optional, Union
+from typing import Any, List, Dict, Sequence, Set, Tuple, Optional, Union
 
 # Type aliases
 Position = Tuple[float, float, float]
 Size = Tuple[float, float, float]
 ColorType = Tuple[int, int, int, int]
+# Instance (x, y, z, scale_x, scale_y, scale_z) records keyed by (mesh kind, color id)
+InstanceBatches = Dict[Tuple[str, int], Tuple[rl.Color, List[Tuple[float, ...]]]]
+
+def _assign_vec3(vec: rl.Vector3, x: float, y: float, z: float) -> rl.Vector3:
+    """Overwrite a reusable Vector3 in place and return it"""
+    vec.x = x
+    vec.y = y
+    vec.z = z
+    return vec
+
+def _build_matrices(positions: np.ndarray, scales: np.ndarray, matrices: np.ndarray) -> np.ndarray:
+    """Fill (N, 16) float32 scale-translate matrices in raylib Matrix field order"""
+    matrices.fill(0.0)
+    matrices[:, 0] = scales[:, 0]
+    matrices[:, 5] = scales[:, 1]
+    matrices[:, 10] = scales[:, 2]
+    matrices[:, 3] = positions[:, 0]
+    matrices[:, 7] = positions[:, 1]
+    matrices[:, 11] = positions[:, 2]
+    matrices[:, 15] = 1.0
+    return matrices
+
+def _append_instance(batches: InstanceBatches, kind: str, color: rl.Color, position: Position, scale: Size):
+    """Append one unit mesh instance to the batch for its mesh and color"""
+    key = (kind, id(color))
+    batch = batches.get(key)
+    if batch is None:
+        batch = batches[key] = (color, [])
+    batch[1].append((position[0], position[1], position[2], scale[0], scale[1], scale[2]))
+
+def _gather_records(batches: InstanceBatches) -> List[Tuple[str, rl.Color, np.ndarray]]:
+    """Convert each batch to (mesh kind, color, (N, 6) float32 instance records)"""
+    return [(kind, color, np.asarray(instances, dtype=np.float32))
+            for (kind, _), (color, instances) in batches.items()]
+
+def _layout_batches(batches: List[Tuple[str, rl.Color, np.ndarray]], matrices: np.ndarray
+                    ) -> Tuple[List[Tuple[str, rl.Color, int, int]], Dict[str, Tuple[int, int]]]:
+    """
+    Build the instance matrices of batches into consecutive rows of matrices.
+    Returns each batch's (mesh kind, color, first row, count) and each mesh's
+    (first row, end row); batches are ordered by mesh so that range is contiguous
+    """
+    batches = sorted(batches, key=lambda batch: batch[0])
+    draws = []
+    mesh_ranges: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for kind, color, records in batches:
+        end = offset + len(records)
+        _build_matrices(records[:, :3], records[:, 3:], matrices[offset:end])
+        draws.append((kind, color, offset, end - offset))
+        mesh_ranges[kind] = (mesh_ranges.get(kind, (offset, end))[0], end)
+        offset = end
+    return draws, mesh_ranges
+
+# Bounds of each unit mesh for a given scale: the bounds center's height above
+# the mesh origin and the half extents, all as fractions of the scale
+_PRIMITIVE_BOUNDS = {
+    "cube": (0.0, 0.5, 0.5, 0.5),
+    "sphere": (0.0, 1.0, 1.0, 1.0),
+    "cylinder": (0.5, 1.0, 0.5, 1.0),
+}
+
+# Marks a label position not yet projected this frame
+_NOT_PROJECTED = object()
+
+# Solid primitives outlined by a wire-mode pass over their instance batches.
+# Cylinders keep an explicit outline since wire mode would show cap triangles
+_OUTLINED_KINDS = ("cube", "sphere")
+
+# Shaders for instanced primitive drawing; each instance supplies its own
+# model matrix through the instanceTransform attribute
+_INSTANCING_VS = """#version 330
+in vec3 vertexPosition;
+in mat4 instanceTransform;
+uniform mat4 mvp;
+void main()
+{
+    gl_Position = mvp*instanceTransform*vec4(vertexPosition, 1.0);
+}
+"""
+
+_INSTANCING_FS = """#version 330
+uniform vec4 colDiffuse;
+out vec4 finalColor;
+void main()
+{
+    finalColor = colDiffuse;
+}
+"""
 
 class Renderer:
     """Renderer class that abstracts the rendering of USD elements"""
@@ -36,6 +126,336 @@ class Renderer:
             "gameplay": rl.Color(200, 150, 50, 255),     # Gold
             "default": rl.Color(150, 150, 150, 255)      # Gray
         }
+        
+        # Named colors are looked up in one dict; tuple colors are converted
+        # to raylib Colors once and reused on later frames
+        self._named_colors = {**self.system_colors, **self.lod_colors}
+        self._color_cache: Dict[Any, rl.Color] = {}
+        self._warned_colors: Set[str] = set()
+        
+        # Color conversion by exact argument type; raylib Colors pass through
+        self._color_dispatch = {
+            str: self._color_from_name,
+            tuple: self._color_from_tuple
+        }
+        
+        # Whether solid primitives get a black wireframe overlay
+        self.show_wireframe = True
+        
+        # Shared colors for wireframe overlays and labels
+        self._wire_black = rl.Color(0, 0, 0, 100)
+        self._label_white = rl.Color(255, 255, 255, 255)
+        
+        # Unit meshes for solid primitives. Solid draws are queued per mesh
+        # and color and submitted as one instanced draw each in flush()
+        self._meshes = {
+            "cube": rl.gen_mesh_cube(1.0, 1.0, 1.0),
+            "sphere": rl.gen_mesh_sphere(1.0, 16, 16),
+            "cylinder": rl.gen_mesh_cylinder(1.0, 1.0, 16)
+        }
+        self._instance_shader = rl.load_shader_from_memory(_INSTANCING_VS, _INSTANCING_FS)
+        self._instance_shader.locs[rl.SHADER_LOC_MATRIX_MODEL] = rl.get_shader_location_attrib(
+            self._instance_shader, "instanceTransform")
+        self._instance_material = rl.load_material_default()
+        self._instance_material.shader = self._instance_shader
+        self._pending: InstanceBatches = {}
+        
+        # Primitives registered once through add_static(). Their instance
+        # matrices, draws and per-mesh row ranges are built into a separate
+        # array only when the static set changes
+        self._static: InstanceBatches = {}
+        self._static_matrices = np.zeros((0, 16), dtype=np.float32)
+        self._static_ptr: Any = None
+        self._static_draws: Optional[List[Tuple[str, rl.Color, int, int]]] = None
+        self._static_ranges: Dict[str, Tuple[int, int]] = {}
+        # (base center, radius, height) of static cylinders for the wire pass
+        self._static_cylinders: List[Tuple[List[float], float, float]] = []
+        
+        # Instance matrices for every draw share one pool that only grows,
+        # with a cached pointer handed to raylib at row offsets
+        self._matrix_pool = np.zeros((1024, 16), dtype=np.float32)
+        self._matrix_ptr = rl.ffi.cast("Matrix *", rl.ffi.from_buffer(self._matrix_pool))
+        
+        # Labels queued during the 3D pass and drawn by flush_labels() in 2D.
+        # Positions are copied into tuples so they can key _projected_labels
+        self._pending_labels: List[Tuple[str, Position, int, rl.Color]] = []
+        
+        # Indicator color and label text per LOD/system name as spelled by callers
+        self._lod_styles: Dict[str, Tuple[rl.Color, str]] = {}
+        self._system_styles: Dict[str, Tuple[rl.Color, str]] = {}
+        
+        # Scratch structs reused by the draw methods. raylib takes these by
+        # value, so overwriting them between calls is safe
+        self._v3_a = rl.Vector3(0.0, 0.0, 0.0)
+        self._v3_b = rl.Vector3(0.0, 0.0, 0.0)
+        self._bounds = rl.BoundingBox()
+        
+        # Screen position of each labelled world position, or None when culled.
+        # Cleared by begin_frame() since it depends on the camera
+        self._projected_labels: Dict[Position, Optional[Tuple[int, int]]] = {}
+        
+        # View frustum planes (a, b, c, d), refreshed by begin_frame()
+        self._frustum_planes: Tuple[Tuple[float, float, float, float], ...] = ()
+        self._frustum_arrays: Tuple[np.ndarray, np.ndarray, np.ndarray] = ()
+    
+    def _resolve_color(self, color: Union[rl.Color, str, ColorType]) -> rl.Color:
+        """Convert a color name or RGB(A) tuple to a raylib Color"""
+        handler = self._color_dispatch.get(type(color))
+        if handler is not None:
+            return handler(color)
+        
+        # Subclasses such as named tuples miss the exact-type table
+        if isinstance(color, str):
+            return self._color_from_name(color)
+        if isinstance(color, tuple):
+            return self._color_from_tuple(color)
+        return color
+    
+    def _color_from_name(self, color: str) -> rl.Color:
+        """Look up a LOD or system color by name"""
+        resolved = self._named_colors.get(color)
+        if resolved is None:
+            # Warn once per name rather than on every frame it is drawn
+            if color not in self._warned_colors:
+                self._warned_colors.add(color)
+                print(f"Warning: Unknown color name '{color}', using default color")
+            resolved = self.system_colors["default"]
+        return resolved
+    
+    def _color_from_tuple(self, color: Tuple[int, ...]) -> rl.Color:
+        """Convert an RGB(A) tuple to a cached raylib Color"""
+        resolved = self._color_cache.get(color)
+        if resolved is None:
+            if len(color) == 3:
+                resolved = rl.Color(color[0], color[1], color[2], 255)
+            else:
+                resolved = rl.Color(color[0], color[1], color[2], color[3])
+            self._color_cache[color] = resolved
+        return resolved
+    
+    def begin_frame(self):
+        """
+        Capture the view frustum for this frame's culling.
+        Must be called after entering 3D mode, before the scene is drawn.
+        """
+        m = rl.matrix_multiply(rl.rl_get_matrix_modelview(), rl.rl_get_matrix_projection())
+        
+        # Rows of the combined view-projection matrix
+        r0 = (m.m0, m.m4, m.m8, m.m12)
+        r1 = (m.m1, m.m5, m.m9, m.m13)
+        r2 = (m.m2, m.m6, m.m10, m.m14)
+        r3 = (m.m3, m.m7, m.m11, m.m15)
+        
+        # Left, right, bottom, top, near and far planes
+        self._frustum_planes = tuple(
+            tuple(w + sign * v for w, v in zip(r3, row))
+            for row in (r0, r1, r2)
+            for sign in (1.0, -1.0)
+        )
+        
+        # Transposed plane normals, their absolute values and plane offsets
+        # for the vectorized test in _visible_mask(), built once per frame
+        planes = np.array(self._frustum_planes, dtype=np.float32)
+        normals_t = np.ascontiguousarray(planes[:, :3].T)
+        self._frustum_arrays = (normals_t, np.abs(normals_t), planes[:, 3].copy())
+        self._projected_labels.clear()
+    
+    def _aabb_visible(self, center: Position, half_extent: Size) -> bool:
+        """Test an axis-aligned box against the frustum captured in begin_frame()"""
+        cx, cy, cz = center
+        hx, hy, hz = half_extent
+        for a, b, c, d in self._frustum_planes:
+            if a * cx + b * cy + c * cz + d + abs(a) * hx + abs(b) * hy + abs(c) * hz < 0.0:
+                return False
+        return True
+    
+    def is_box_visible(self, center: Position, half_extent: Size) -> bool:
+        """
+        Test whether an axis-aligned box is inside this frame's view frustum.
+        Lets callers skip building draws for objects that would all be culled.
+        
+        Args:
+            center: (x, y, z) box center
+            half_extent: Half the box size along each axis
+            
+        Returns:
+            False if the box is entirely outside the frustum
+        """
+        return self._aabb_visible(center, half_extent)
+    
+    def _queue_instance(self, kind: str, color: rl.Color, position: Position, scale: Size):
+        """Queue one instance of a unit mesh for the batched draw in flush()"""
+        _append_instance(self._pending, kind, color, position, scale)
+    
+    def add_static(self, kind: str, position: Position, scale: Size,
+                   color: Union[rl.Color, str, ColorType]):
+        """
+        Register a solid primitive that is drawn every frame by flush()
+        without any further per-frame calls
+        
+        Args:
+            kind: Unit mesh to draw ("cube", "sphere" or "cylinder")
+            position: (x, y, z) center, or base center for cylinders
+            scale: Box size, (radius, radius, radius) for spheres
+                or (radius, height, radius) for cylinders
+            color: Color to use (string name, RGB tuple, or raylib Color)
+        """
+        _append_instance(self._static, kind, self._resolve_color(color), position, scale)
+        self._static_draws = None
+    
+    def draw_primitives(self, kinds: Sequence[str], positions: np.ndarray, scales: np.ndarray,
+                        colors: Sequence[rl.Color]) -> np.ndarray:
+        """
+        Queue many solid primitives for flush() in one call, culling them
+        against the frustum in a single vectorized test
+        
+        Args:
+            kinds: Unit mesh per primitive ("cube", "sphere" or "cylinder")
+            positions: (N, 3) array of centers, or base centers for cylinders
+            scales: (N, 3) array of scales, as for add_static()
+            colors: Resolved raylib Color per primitive
+            
+        Returns:
+            (N,) bool array, True for the primitives that were not culled
+        """
+        positions = np.asarray(positions, dtype=np.float32)
+        scales = np.asarray(scales, dtype=np.float32)
+        
+        # Per-kind bounds: cylinders rise from their base, boxes are sized
+        # by their full extent
+        bounds = np.array([_PRIMITIVE_BOUNDS[kind] for kind in kinds], dtype=np.float32)
+        half_extents = scales * bounds[:, 1:]
+        centers = positions.copy()
+        centers[:, 1] += scales[:, 1] * bounds[:, 0]
+        visible = self._visible_mask(centers, half_extents)
+        
+        records = np.hstack((positions, scales)).tolist()
+        for kind, color, record, shown in zip(kinds, colors, records, visible.tolist()):
+            if shown:
+                _append_instance(self._pending, kind, color, record[:3], record[3:])
+                # Cylinders are not covered by the wire-mode outline pass
+                if kind == "cylinder" and self.show_wireframe:
+                    self._draw_cylinder_wires(record[:3], record[3], record[4], self._wire_black)
+        return visible
+    
+    def clear_static(self):
+        """Remove all primitives registered with add_static()"""
+        self._static.clear()
+        self._static_draws = None
+    
+    def flush(self):
+        """
+        Submit static and queued solid primitives, one instanced draw per mesh
+        and color. Must be called inside 3D mode, after the demo has rendered
+        its scene.
+        """
+        # Static matrices are only rebuilt after the static set changes
+        if self._static_draws is None:
+            batches = _gather_records(self._static)
+            total = sum(len(records) for _, _, records in batches)
+            self._static_matrices = np.zeros((total, 16), dtype=np.float32)
+            self._static_ptr = (rl.ffi.cast("Matrix *", rl.ffi.from_buffer(self._static_matrices))
+                                if total else None)
+            self._static_draws, self._static_ranges = _layout_batches(batches, self._static_matrices)
+            self._static_cylinders = [
+                (record[:3], record[3], record[4])
+                for kind, _, records in batches if kind == "cylinder"
+                for record in records.tolist()
+            ]
+        
+        # Only this frame's queued primitives are built into the matrix pool
+        batches = _gather_records(self._pending)
+        pool = self._reserve_matrices(sum(len(records) for _, _, records in batches))
+        draws, mesh_ranges = _layout_batches(batches, pool)
+        
+        for kind, color, start, count in self._static_draws:
+            self._draw_instanced(kind, color, self._static_ptr + start, count)
+        for kind, color, start, count in draws:
+            self._draw_instanced(kind, color, self._matrix_ptr + start, count)
+        
+        # Black outlines for every box and sphere, one draw per mesh and
+        # matrix array. Queued cylinders were outlined when drawn
+        if self.show_wireframe:
+            for position, radius, height in self._static_cylinders:
+                self._draw_cylinder_wires(position, radius, height, self._wire_black)
+            for kind in _OUTLINED_KINDS:
+                for matrix_ptr, ranges in ((self._static_ptr, self._static_ranges),
+                                           (self._matrix_ptr, mesh_ranges)):
+                    if kind in ranges:
+                        start, end = ranges[kind]
+                        self._draw_instanced_wires(kind, self._wire_black, matrix_ptr + start, end - start)
+        
+        self._pending.clear()
+    
+    def _reserve_matrices(self, count: int) -> np.ndarray:
+        """Return the first count rows of the matrix pool, doubling it when too small"""
+        capacity = len(self._matrix_pool)
+        if count > capacity:
+            while capacity < count:
+                capacity *= 2
+            self._matrix_pool = np.zeros((capacity, 16), dtype=np.float32)
+            self._matrix_ptr = rl.ffi.cast("Matrix *", rl.ffi.from_buffer(self._matrix_pool))
+        return self._matrix_pool[:count]
+    
+    def _draw_instanced(self, kind: str, color: rl.Color, transforms: Any, count: int):
+        """Draw count instances of a unit mesh from a pointer to raylib Matrix structs"""
+        material = self._instance_material
+        material.maps[rl.MATERIAL_MAP_DIFFUSE].color = color
+        rl.draw_mesh_instanced(self._meshes[kind], material, transforms, count)
+    
+    def _draw_instanced_wires(self, kind: str, color: rl.Color, transforms: Any, count: int):
+        """Draw the edges of count unit mesh instances using GL wire mode"""
+        rl.rl_enable_wire_mode()
+        self._draw_instanced(kind, color, transforms, count)
+        rl.rl_disable_wire_mode()
+    
+    def _visible_mask(self, centers: np.ndarray, half_extents: np.ndarray) -> np.ndarray:
+        """Vectorized frustum test for (N, 3) box centers and half extents"""
+        if not self._frustum_planes:
+            return np.ones(len(centers), dtype=bool)
+        normals_t, abs_normals_t, offsets = self._frustum_arrays
+        distances = centers @ normals_t
+        distances += offsets
+        distances += half_extents @ abs_normals_t
+        return (distances >= 0.0).all(axis=1)
+    
+    def flush_labels(self):
+        """
+        Draw all queued 3D labels as screen-space text.
+        Must be called after leaving 3D mode.
+        """
+        camera = self.app.camera
+        width = rl.get_screen_width()
+        height = rl.get_screen_height()
+        projected = self._projected_labels
+        for text, position, font_size, color in self._pending_labels:
+            # Labels stacked at the same position share one projection
+            screen_pos = projected.get(position, _NOT_PROJECTED)
+            if screen_pos is _NOT_PROJECTED:
+                screen_pos = None
+                # Skip labels behind the camera or outside the view volume
+                if self._aabb_visible(position, (0.0, 0.0, 0.0)):
+                    projected_pos = rl.get_world_to_screen(
+                        _assign_vec3(self._v3_a, position[0], position[1], position[2]), camera)
+                    x = int(projected_pos.x)
+                    y = int(projected_pos.y)
+                    # Skip labels that project outside the window
+                    if 0 <= x < width and 0 <= y < height:
+                        screen_pos = (x, y)
+                projected[position] = screen_pos
+            
+            if screen_pos is not None:
+                rl.draw_text(text, screen_pos[0], screen_pos[1], font_size, color)
+        
+        self._pending_labels.clear()
+    
+    def unload(self):
+        """Release GPU resources owned by the renderer"""
+        for mesh in self._meshes.values():
+            rl.unload_mesh(mesh)
+        self._meshes.clear()
+        # Unloading the material also releases its instancing shader
+        rl.unload_material(self._instance_material)
     
     def draw_box(self, position: Position, size: Size, color: Union[rl.Color, str, ColorType], 
                 wire: bool = False, label: Optional[str] = None):
@@ -49,41 +469,70 @@ class Renderer:
             wire: Whether to draw as wireframe
             label: Optional text label to display
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
-        
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
+        # Queue label if provided and the box was not culled
+        if self.draw_box_c(position, size, self._resolve_color(color), wire) and label:
+            self._pending_labels.append((label, (position[0], position[1], position[2]), 20, self._label_white))
+    
+    def draw_box_c(self, position: Position, size: Size, color: rl.Color, wire: bool = False) -> bool:
+        """
+        Draw a box with an already resolved raylib Color. Fast path of draw_box
+        for callers that resolve their colors once, e.g. when a prim's LOD changes.
         
-        # Create position and size as Vector3
-        pos = rl.Vector3(position[0], position[1], position[2])
-        sz = rl.Vector3(size[0], size[1], size[2])
+        Returns:
+            False if the box was culled
+        """
+        if not self._aabb_visible(position, (size[0] * 0.5, size[1] * 0.5, size[2] * 0.5)):
+            return False
         
-        # Draw box
         if wire:
-            rl.draw_cube_wires(pos, sz.x, sz.y, sz.z, color)
+            rl.draw_cube_wires(_assign_vec3(self._v3_a, position[0], position[1], position[2]),
+                               size[0], size[1], size[2], color)
         else:
-            rl.draw_cube(pos, sz.x, sz.y, sz.z, color)
-            # Also draw wireframe in black for better visibility
-            rl.draw_cube_wires(pos, sz.x, sz.y, sz.z, rl.Color(0, 0, 0, 100))
+            # Queued solid boxes are also outlined in black by flush()
+            self._queue_instance("cube", color, position, size)
+        return True
+    
+    def draw_boxes(self, positions: np.ndarray, sizes: np.ndarray, colors: np.ndarray,
+                   wire: bool = False):
+        """
+        Draw many boxes in one vectorized pass
         
-        # Draw label if provided
-        if label:
-            # Calculate screen position
-            screen_pos = rl.get_world_to_screen(pos, self.app.camera)
-            # Draw text
-            rl.draw_text(label, int(screen_pos.x), int(screen_pos.y), 20, rl.Color(255, 255, 255, 255))
+        Args:
+            positions: (N, 3) array of box centers
+            sizes: (N, 3) array of box sizes
+            colors: (N, 4) array of RGBA colors (0-255)
+            wire: Whether to draw as wireframe
+        """
+        positions = np.asarray(positions, dtype=np.float32)
+        sizes = np.asarray(sizes, dtype=np.float32)
+        colors = np.asarray(colors, dtype=np.uint8)
+        
+        visible = self._visible_mask(positions, sizes * 0.5)
+        positions = positions[visible]
+        sizes = sizes[visible]
+        if not len(positions):
+            return
+        
+        # Order boxes by color so each color is one contiguous run of the
+        # matrix pool, drawn with one instanced call
+        unique_colors, color_ids = np.unique(colors[visible], axis=0, return_inverse=True)
+        color_ids = color_ids.reshape(-1)
+        order = np.argsort(color_ids, kind="stable")
+        count = len(order)
+        _build_matrices(positions[order], sizes[order], self._reserve_matrices(count))
+        
+        offset = 0
+        for rgba, run in zip(unique_colors.tolist(), np.bincount(color_ids).tolist()):
+            color = self._resolve_color(tuple(rgba))
+            if wire:
+                self._draw_instanced_wires("cube", color, self._matrix_ptr + offset, run)
+            else:
+                self._draw_instanced("cube", color, self._matrix_ptr + offset, run)
+            offset += run
+        
+        # Outline all solid boxes in black with a single wire-mode draw
+        if not wire and self.show_wireframe:
+            self._draw_instanced_wires("cube", self._wire_black, self._matrix_ptr, count)
     
     def draw_sphere(self, position: Position, radius: float, color: Union[rl.Color, str, ColorType],
                    wire: bool = False, label: Optional[str] = None):
@@ -97,40 +546,28 @@ class Renderer:
             wire: Whether to draw as wireframe
             label: Optional text label to display
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
-        
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
+        # Queue label if provided and the sphere was not culled
+        if self.draw_sphere_c(position, radius, self._resolve_color(color), wire) and label:
+            self._pending_labels.append((label, (position[0], position[1], position[2]), 20, self._label_white))
+    
+    def draw_sphere_c(self, position: Position, radius: float, color: rl.Color, wire: bool = False) -> bool:
+        """
+        Draw a sphere with an already resolved raylib Color. Fast path of
+        draw_sphere for callers that resolve their colors once.
         
-        # Create position as Vector3
-        pos = rl.Vector3(position[0], position[1], position[2])
+        Returns:
+            False if the sphere was culled
+        """
+        if not self._aabb_visible(position, (radius, radius, radius)):
+            return False
         
-        # Draw sphere
         if wire:
-            rl.draw_sphere_wires(pos, radius, 8, 8, color)
+            rl.draw_sphere_wires(_assign_vec3(self._v3_a, position[0], position[1], position[2]),
+                                 radius, 8, 8, color)
         else:
-            rl.draw_sphere(pos, radius, color)
-            # Also draw wireframe in black for better visibility
-            rl.draw_sphere_wires(pos, radius, 8, 8, rl.Color(0, 0, 0, 100))
-        
-        # Draw label if provided
-        if label:
-            # Calculate screen position
-            screen_pos = rl.get_world_to_screen(pos, self.app.camera)
-            # Draw text
-            rl.draw_text(label, int(screen_pos.x), int(screen_pos.y), 20, rl.Color(255, 255, 255, 255))
+            # Queued solid spheres are also outlined in black by flush()
+            self._queue_instance("sphere", color, position, (radius, radius, radius))
+        return True
     
     def draw_cylinder(self, position: Position, radius: float, height: float, color: Union[rl.Color, str, ColorType],
                      wire: bool = False, label: Optional[str] = None):
@@ -145,78 +582,39 @@ class Renderer:
             wire: Whether to draw as wireframe
             label: Optional text label to display
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
-        
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
+        # Queue label at the center of the cylinder if provided and not culled
+        if self.draw_cylinder_c(position, radius, height, self._resolve_color(color), wire) and label:
+            center_pos = (position[0], position[1] + height / 2, position[2])
+            self._pending_labels.append((label, center_pos, 20, self._label_white))
+    
+    def draw_cylinder_c(self, position: Position, radius: float, height: float, color: rl.Color,
+                        wire: bool = False) -> bool:
+        """
+        Draw a cylinder with an already resolved raylib Color. Fast path of
+        draw_cylinder for callers that resolve their colors once.
         
-        # Create position as Vector3
-        pos = rl.Vector3(position[0], position[1], position[2])
+        Returns:
+            False if the cylinder was culled
+        """
+        half_height = height * 0.5
+        if not self._aabb_visible((position[0], position[1] + half_height, position[2]),
+                                  (radius, half_height, radius)):
+            return False
         
-        # PyRay requires a different approach for drawing cylinders
         if wire:
-            # There's no direct cylinder wire drawing in PyRay
-            # So we'll approximate with multiple circle wires
-            segments = 8
-            for i in range(segments + 1):
-                y = position[1] + (height * i / segments)
-                center = rl.Vector3(position[0], y, position[2])
-                rl.draw_circle_3d(center, radius, rl.Vector3(0, 1, 0), 0, color)
-            
-            # Connect circles with lines
-            for angle in range(0, 360, 45):
-                rad_angle = angle * 0.0174533  # Convert to radians
-                x_offset = radius * rl.cos(rad_angle)
-                z_offset = radius * rl.sin(rad_angle)
-                
-                start = rl.Vector3(pos.x + x_offset, pos.y, pos.z + z_offset)
-                end = rl.Vector3(pos.x + x_offset, pos.y + height, pos.z + z_offset)
-                
-                rl.draw_line_3d(start, end, color)
+            self._draw_cylinder_wires(position, radius, height, color)
         else:
-            # In PyRay we need to provide start and end positions for cylinder
-            start_pos = rl.Vector3(position[0], position[1], position[2])
-            end_pos = rl.Vector3(position[0], position[1] + height, position[2])
-            rl.draw_cylinder(start_pos, end_pos, radius, 16, 1, color)
-            
+            # The unit cylinder mesh has its base at the origin
+            self._queue_instance("cylinder", color, position, (radius, height, radius))
             # Also draw wireframe for better visibility
-            # Approximate wireframe for the cylinder
-            segments = 8
-            for i in range(segments + 1):
-                y = position[1] + (height * i / segments)
-                center = rl.Vector3(position[0], y, position[2])
-                rl.draw_circle_3d(center, radius, rl.Vector3(0, 1, 0), 0, rl.Color(0, 0, 0, 100))
-            
-            # Connect circles with lines
-            for angle in range(0, 360, 45):
-                rad_angle = angle * 0.0174533  # Convert to radians
-                x_offset = radius * rl.cos(rad_angle)
-                z_offset = radius * rl.sin(rad_angle)
-                
-                start = rl.Vector3(pos.x + x_offset, pos.y, pos.z + z_offset)
-                end = rl.Vector3(pos.x + x_offset, pos.y + height, pos.z + z_offset)
-                
-                rl.draw_line_3d(start, end, rl.Color(0, 0, 0, 100))
-        
-        # Draw label if provided
-        if label:
-            # Calculate screen position for center of cylinder
-            center_pos = rl.Vector3(pos.x, pos.y + height/2, pos.z)
-            screen_pos = rl.get_world_to_screen(center_pos, self.app.camera)
-            # Draw text
-            rl.draw_text(label, int(screen_pos.x), int(screen_pos.y), 20, rl.Color(255, 255, 255, 255))
+            if self.show_wireframe:
+                self._draw_cylinder_wires(position, radius, height, self._wire_black)
+        return True
+    
+    def _draw_cylinder_wires(self, position: Position, radius: float, height: float, color: rl.Color):
+        """Draw both caps and 8 side edges of a cylinder in one raylib call"""
+        rl.draw_cylinder_wires(_assign_vec3(self._v3_a, position[0], position[1], position[2]),
+                               radius, radius, height, 8, color)
     
     def draw_line_3d(self, start_pos: Position, end_pos: Position, color: Union[rl.Color, str, ColorType]):
         """
@@ -227,26 +625,10 @@ class Renderer:
             end_pos: (x, y, z) end position
             color: Color to use
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
-        
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
+        color = self._resolve_color(color)
         
-        # Create Vector3 positions
-        start = rl.Vector3(start_pos[0], start_pos[1], start_pos[2])
-        end = rl.Vector3(end_pos[0], end_pos[1], end_pos[2])
+        start = _assign_vec3(self._v3_a, start_pos[0], start_pos[1], start_pos[2])
+        end = _assign_vec3(self._v3_b, end_pos[0], end_pos[1], end_pos[2])
         
         # Draw line
         rl.draw_line_3d(start, end, color)
@@ -264,29 +646,12 @@ class Renderer:
             max_point: (x, y, z) maximum point
             color: Color to use
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
+        color = self._resolve_color(color)
         
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
-        
-        # Create bounding box - PyRay uses a different structure
-        min_vec = rl.Vector3(min_point[0], min_point[1], min_point[2])
-        max_vec = rl.Vector3(max_point[0], max_point[1], max_point[2])
-        bounds = rl.BoundingBox()
-        bounds.min = min_vec
-        bounds.max = max_vec
+        # Fill the reusable bounding box in place
+        bounds = self._bounds
+        _assign_vec3(bounds.min, min_point[0], min_point[1], min_point[2])
+        _assign_vec3(bounds.max, max_point[0], max_point[1], max_point[2])
         
         # Draw bounding box
         rl.draw_bounding_box(bounds, color)
@@ -302,29 +667,10 @@ class Renderer:
             font_size: Font size
             color: Text color
         """
-        # Convert string color to raylib Color
-        if isinstance(color, str):
-            if color in self.lod_colors:
-                color = self.lod_colors[color]
-            elif color in self.system_colors:
-                color = self.system_colors[color]
-            else:
-                print(f"Warning: Unknown color name '{color}', using default color")
-                color = self.system_colors["default"]
+        color = self._resolve_color(color)
         
-        # Convert tuple color to raylib Color
-        elif isinstance(color, tuple):
-            if len(color) == 3:
-                color = rl.Color(color[0], color[1], color[2], 255)
-            else:
-                color = rl.Color(color[0], color[1], color[2], color[3])
-        
-        # Calculate screen position
-        pos_3d = rl.Vector3(position[0], position[1], position[2])
-        screen_pos = rl.get_world_to_screen(pos_3d, self.app.camera)
-        
-        # Draw text
-        rl.draw_text(text, int(screen_pos.x), int(screen_pos.y), font_size, color)
+        # Text is drawn in the 2D label pass after the 3D scene
+        self._pending_labels.append((text, (position[0], position[1], position[2]), font_size, color))
     
     def draw_lod_indicator(self, position: Position, lod_level: str, size: float = 0.5):
         """
@@ -338,15 +684,20 @@ class Renderer:
         # Position slightly above the main object
         pos = (position[0], position[1] + size * 2, position[2])
         
-        # Get color for the LOD level
-        color = self.lod_colors.get(lod_level.lower(), self.lod_colors["high"])
+        # Get color and label for the LOD level
+        style = self._lod_styles.get(lod_level)
+        if style is None:
+            color = self.lod_colors.get(lod_level.lower(), self.lod_colors["high"])
+            style = self._lod_styles[lod_level] = (color, lod_level.upper())
+        color, text = style
         
-        # Draw a small sphere
-        self.draw_sphere(pos, size * 0.3, color, wire=False)
+        # Queue a small sphere straight into the instance batch for this LOD color
+        radius = size * 0.3
+        self._queue_instance("sphere", color, pos, (radius, radius, radius))
         
         # Draw text
         text_pos = (pos[0], pos[1] + size * 0.5, pos[2])
-        self.draw_text_3d(text_pos, lod_level.upper(), 16, (255, 255, 255, 255))
+        self.draw_text_3d(text_pos, text, 16, self._label_white)
     
     def draw_system_indicator(self, position: Position, system_name: str, 
                              size: float = 0.5, offset_x: float = 0.0):
@@ -362,12 +713,17 @@ class Renderer:
         # Position with offset
         pos = (position[0] + offset_x, position[1] + size * 3, position[2])
         
-        # Get color for the system
-        color = self.system_colors.get(system_name.lower(), self.system_colors["default"])
+        # Get color and label for the system
+        style = self._system_styles.get(system_name)
+        if style is None:
+            color = self.system_colors.get(system_name.lower(), self.system_colors["default"])
+            style = self._system_styles[system_name] = (color, system_name.upper())
+        color, text = style
         
-        # Draw a small cube
-        self.draw_box(pos, (size * 0.4, size * 0.4, size * 0.4), color, wire=False)
+        # Queue a small cube straight into the instance batch for this system color
+        edge = size * 0.4
+        self._queue_instance("cube", color, pos, (edge, edge, edge))
         
         # Draw text
         text_pos = (pos[0], pos[1] + size * 0.3, pos[2])
-        self.draw_text_3d(text_pos, system_name.upper(), 14, (255, 255, 255, 255))
\ No newline at end of file
+        self.draw_text_3d(text_pos, text, 14, self._label_white)
\ No newline at end of file
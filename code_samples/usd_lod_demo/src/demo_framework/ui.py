@@ -4,12 +4,58 @@ UI Module
 Provides a simple UI system for the demos built on top of Raylib.
 """
 
+import sys
+
 import pyray as rl
 from typing import Optional, Tuple, Dict, List, Callable
 
+# Maximum number of cached text measurements before the cache is reset
+TEXT_WIDTH_CACHE_SIZE = 2048
+
+# Maximum number of cached button label layouts before the cache is reset
+LAYOUT_CACHE_SIZE = 2048
+
+# Extra pixels around a cached panel texture for widgets that reach slightly
+# past the panel edge, such as slider knobs
+PANEL_CACHE_MARGIN = 32
+
+# OpenGL blend factors used while rendering panels into their textures
+_GL_ONE = 1
+_GL_SRC_ALPHA = 0x0302
+_GL_ONE_MINUS_SRC_ALPHA = 0x0303
+_GL_FUNC_ADD = 0x8006
+
+# Names of the UI colors; each is also bound to a _col_<name> attribute
+_COLOR_NAMES = (
+    "panel_bg", "panel_border", "panel_title",
+    "button", "button_hover", "button_active", "button_text",
+    "slider_bg", "slider_knob", "slider_active", "slider_text",
+    "label",
+    "dropdown_bg", "dropdown_border", "dropdown_item", "dropdown_item_hover", "dropdown_text",
+)
+
+
+def _submit_framed_rect(x: int, y: int, width: int, height: int,
+                        fill: rl.Color, border: rl.Color):
+    """Draw a filled rectangle followed directly by its border"""
+    rl.draw_rectangle(x, y, width, height, fill)
+    rl.draw_rectangle_lines(x, y, width, height, border)
+
+
 class UI:
     """Simple UI system for the demos"""
     
+    __slots__ = (
+        "app", "_font_size", "_padding", "_row_h", "_title_h", "_pad2", "active_panels", "panel_stack", "colors",
+        "hot_item", "active_item", "mouse_x", "mouse_y", "was_mouse_pressed",
+        "mouse_pressed", "mouse_released", "mouse_down",
+        "dragging_slider", "open_dropdown",
+        "_state_index", "_slider_state", "_dropdown_state", "_checkbox_state",
+        "_mouse_in_panel", "_dropdown_geom", "_layers", "_overlay", "_triangle",
+        "_id_cache", "_layout_cache", "_text_width_cache",
+        "_panel_records", "_panel_cache", "_panel_src", "_panel_dst",
+    ) + tuple(f"_col_{name}" for name in _COLOR_NAMES)
+    
     def __init__(self, app):
         self.app = app
         self.font_size = 20
@@ -17,6 +63,10 @@ class UI:
         self.active_panels = []
         self.panel_stack = []
         
+        # Whether the mouse is inside each open panel, aligned with panel_stack.
+        # The bottom entry stands for widgets drawn outside any panel
+        self._mouse_in_panel: List[bool] = [True]
+        
         # UI colors
         self.colors = {
             "panel_bg": rl.Color(30, 30, 30, 200),
@@ -38,39 +88,120 @@ class UI:
             "dropdown_text": rl.Color(255, 255, 255, 255),
         }
         
+        # Widgets read colors through plain attributes (self._col_button, ...)
+        # rather than a dict lookup per use; colors are bound here once
+        for name, color in self.colors.items():
+            setattr(self, f"_col_{name}", color)
+        
         # Track UI state
         self.hot_item = None
         self.active_item = None
-        self.mouse_pos = (0, 0)
+        self.mouse_x = 0
+        self.mouse_y = 0
         self.was_mouse_pressed = False
         
+        # Left mouse button state, polled once per frame in begin_frame()
+        self.mouse_pressed = False
+        self.mouse_released = False
+        self.mouse_down = False
+        
         # For sliders
         self.dragging_slider = None
-        self.slider_values = {}
         
         # For dropdowns
         self.open_dropdown = None
         
+        # Widget state, held in one list per widget kind. Each widget ID maps
+        # to its slot in its kind's list when the widget is first drawn
+        self._state_index: Dict[str, int] = {}
+        self._slider_state: List[float] = []
+        self._dropdown_state: List[int] = []
+        self._checkbox_state: List[bool] = []
+        
+        # Open dropdown list geometry keyed by dropdown ID: the key it was
+        # built for (options identity and length, position, font size), the
+        # row height and each option row's y
+        self._dropdown_geom: Dict[str, Tuple[Tuple, int, Tuple[int, ...]]] = {}
+        
+        # Draw commands recorded by widgets and submitted in end_frame(). Each
+        # layer keeps its shapes and its text apart so raylib's batcher only
+        # switches between the shape and font textures twice per layer
+        self._layers: List[Tuple[List, List]] = [([], [])]
+        self._overlay: Tuple[List, List] = ([], [])
+        
+        # Open panels as (panel ID, x, y, width, height, index of the panel's
+        # first layer), and finished panels' render textures keyed by panel ID
+        # along with the layers each texture was rendered from
+        self._panel_records: List[Tuple[str, int, int, int, int, int]] = []
+        self._panel_cache: Dict[str, Tuple[List, object]] = {}
+        self._panel_src = rl.Rectangle(0, 0, 0, 0)
+        self._panel_dst = rl.Vector2(0, 0)
+        
+        # Triangle points reused for every dropdown arrow; raylib takes them
+        # by value, so they are overwritten just before each draw
+        self._triangle = (rl.Vector2(0, 0), rl.Vector2(0, 0), rl.Vector2(0, 0))
+        
+        # Interned widget IDs keyed by the arguments they are built from
+        self._id_cache: Dict[Tuple, str] = {}
+        
+        # Centered button label positions keyed by label, font size and rect
+        self._layout_cache: Dict[Tuple[str, int, int, int, int, int], Tuple[int, int]] = {}
+        
+        # Measured text widths keyed by (text, font_size)
+        self._text_width_cache: Dict[Tuple[str, int], int] = {}
+        
+    @property
+    def font_size(self) -> int:
+        """Font size used by all widgets"""
+        return self._font_size
+    
+    @font_size.setter
+    def font_size(self, value: int):
+        self._font_size = value
+        # Dropdown row height and the gap below titles and labels
+        self._row_h = value + 10
+        self._title_h = value + 5
+    
+    @property
+    def padding(self) -> int:
+        """Padding between a panel's edge and its content"""
+        return self._padding
+    
+    @padding.setter
+    def padding(self, value: int):
+        self._padding = value
+        self._pad2 = value * 2
+    
     def begin_frame(self):
         """Begin a new UI frame"""
         self.active_panels = []
-        self.mouse_pos = (rl.get_mouse_x(), rl.get_mouse_y())
+        self._mouse_in_panel = [True]
+        self._panel_records = []
+        self._layers = [([], [])]
+        self._overlay = ([], [])
+        mouse = rl.get_mouse_position()
+        self.mouse_x = int(mouse.x)
+        self.mouse_y = int(mouse.y)
+        
+        # Poll the left button once; widgets read these flags
+        pressed = self.mouse_pressed = rl.is_mouse_button_pressed(rl.MOUSE_BUTTON_LEFT)
+        released = self.mouse_released = rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT)
+        self.mouse_down = rl.is_mouse_button_down(rl.MOUSE_BUTTON_LEFT)
+        
+        # A press activates the item hovered last frame; a release ends drags
+        self.active_item = self.hot_item if pressed else self.active_item
+        self.was_mouse_pressed = pressed or (self.was_mouse_pressed and not released)
+        self.dragging_slider = None if released else self.dragging_slider
         self.hot_item = None
-        
-        # Check if mouse was pressed this frame
-        mouse_pressed = rl.is_mouse_button_pressed(rl.MOUSE_BUTTON_LEFT)
-        if mouse_pressed:
-            self.active_item = self.hot_item
-            self.was_mouse_pressed = True
-        elif rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT):
-            self.was_mouse_pressed = False
-            if self.dragging_slider:
-                self.dragging_slider = None
     
     def end_frame(self):
         """End the current UI frame"""
+        # Submit recorded draws layer by layer, open dropdown lists last
+        self._layers.append(self._overlay)
+        self._submit_layers(self._layers)
+        
         # If mouse was released, clear active item
-        if rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT):
+        if self.mouse_released:
             self.active_item = None
     
     def begin_panel(self, title: str, x: int, y: int, width: int, height: int) -> Tuple[int, int, int, int]:
@@ -85,31 +216,117 @@ class UI:
         Returns:
             Tuple of (x, y, width, height) for the content area
         """
+        # The panel's chrome and widgets start in a layer of their own so
+        # end_panel() can hand them to the panel cache as a unit
+        self._panel_records.append(
+            (self._widget_id("panel", title), x, y, width, height, len(self._layers))
+        )
+        self._layers.append(([], []))
+        
         # Draw panel background
-        rl.draw_rectangle(x, y, width, height, self.colors["panel_bg"])
-        rl.draw_rectangle_lines(x, y, width, height, self.colors["panel_border"])
+        self._draw_framed_rect(x, y, width, height, self._col_panel_bg, self._col_panel_border)
         
         # Draw title
-        rl.draw_text(title, x + 10, y + 5, self.font_size, self.colors["panel_title"])
+        self._draw_text(title, x + 10, y + 5, self.font_size, self._col_panel_title)
         
         # Calculate content area
-        content_x = x + self.padding
-        content_y = y + self.padding + self.font_size + 5
-        content_width = width - (self.padding * 2)
-        content_height = height - (self.padding * 2) - self.font_size - 5
+        content_x = x + self._padding
+        content_y = y + self._padding + self._title_h
+        content_width = width - self._pad2
+        content_height = height - self._pad2 - self._title_h
         
         # Add to active panels
         self.active_panels.append((x, y, width, height))
         
+        # Widgets after the panel chrome draw in a new layer above it
+        self._layers.append(([], []))
+        
         # Push to panel stack
         self.panel_stack.append((content_x, content_y, content_width, content_height))
         
+        # Widgets in a panel the mouse is not over can skip their own hit tests
+        self._mouse_in_panel.append(self.is_point_in_rect(
+            self.mouse_x, self.mouse_y, x, y, width, height
+        ))
+        
         return content_x, content_y, content_width, content_height
     
     def end_panel(self):
         """End the current UI panel"""
         if self.panel_stack:
             self.panel_stack.pop()
+        if len(self._mouse_in_panel) > 1:
+            self._mouse_in_panel.pop()
+        
+        # Replace the panel's layers with one cached draw. Nested panels stay
+        # inline in their parent, which is cached as a whole
+        if self._panel_records:
+            panel_id, x, y, width, height, first = self._panel_records.pop()
+            if not self._panel_records:
+                layers = self._layers[first:]
+                del self._layers[first:]
+                self._layers.append(
+                    ([(self._submit_panel, (panel_id, x, y, width, height, layers))], [])
+                )
+        
+        # Widgets after the panel draw above it
+        self._layers.append(([], []))
+    
+    def _submit_layers(self, layers: List[Tuple[List, List]]):
+        """Submit recorded draws layer by layer"""
+        for shapes, texts in layers:
+            for draw_fn, args in shapes:
+                draw_fn(*args)
+            for text, x, y, font_size, color in texts:
+                rl.draw_text(text, x, y, font_size, color)
+    
+    def _submit_panel(self, panel_id: str, x: int, y: int, width: int, height: int,
+                      layers: List[Tuple[List, List]]):
+        """Draw a panel from its render texture, re-rendering it only when its draws changed"""
+        margin = PANEL_CACHE_MARGIN
+        tex_width = width + margin * 2
+        tex_height = height + margin * 2
+        
+        cached = self._panel_cache.get(panel_id)
+        target = cached[1] if cached is not None else None
+        if cached is None or cached[0] != layers:
+            if target is None or target.texture.width != tex_width or target.texture.height != tex_height:
+                if target is not None:
+                    rl.unload_render_texture(target)
+                target = rl.load_render_texture(tex_width, tex_height)
+            
+            # Render with premultiplied alpha so the texture composites like
+            # the individual draws would have
+            rl.begin_texture_mode(target)
+            rl.clear_background(rl.BLANK)
+            rl.rl_set_blend_factors_separate(_GL_SRC_ALPHA, _GL_ONE_MINUS_SRC_ALPHA,
+                                             _GL_ONE, _GL_ONE_MINUS_SRC_ALPHA,
+                                             _GL_FUNC_ADD, _GL_FUNC_ADD)
+            rl.begin_blend_mode(rl.BLEND_CUSTOM_SEPARATE)
+            rl.rl_push_matrix()
+            rl.rl_translatef(margin - x, margin - y, 0)
+            self._submit_layers(layers)
+            rl.rl_pop_matrix()
+            rl.end_blend_mode()
+            rl.end_texture_mode()
+            self._panel_cache[panel_id] = (layers, target)
+        
+        # Render textures are stored upside down
+        src = self._panel_src
+        src.width = tex_width
+        src.height = -tex_height
+        dst = self._panel_dst
+        dst.x = x - margin
+        dst.y = y - margin
+        rl.begin_blend_mode(rl.BLEND_ALPHA_PREMULTIPLY)
+        rl.draw_texture_rec(target.texture, src, dst, rl.WHITE)
+        rl.end_blend_mode()
+    
+    def unload(self):
+        """Release the cached panel textures"""
+        for _, target in self._panel_cache.values():
+            rl.unload_render_texture(target)
+        self._panel_cache.clear()
     
     def get_panel_content_area(self) -> Tuple[int, int, int, int]:
         """Get the content area of the current panel"""
@@ -119,11 +336,55 @@ class UI:
             
         return self.panel_stack[-1]
     
-    def is_point_in_rect(self, x: int, y: int, rect_x: int, rect_y: int, 
+    def _draw_shape(self, draw_fn: Callable, *args, overlay: bool = False):
+        """Record a raylib shape draw for end_frame()"""
+        (self._overlay if overlay else self._layers[-1])[0].append((draw_fn, args))
+    
+    def _draw_text(self, text: str, x: int, y: int, font_size: int, color: rl.Color,
+                   overlay: bool = False):
+        """Record a text draw for end_frame()"""
+        (self._overlay if overlay else self._layers[-1])[1].append((text, x, y, font_size, color))
+    
+    def _draw_framed_rect(self, x: int, y: int, width: int, height: int,
+                          fill: rl.Color, border: rl.Color, overlay: bool = False):
+        """Record a filled rectangle and its border as a single draw"""
+        self._draw_shape(_submit_framed_rect, x, y, width, height, fill, border, overlay=overlay)
+    
+    def _draw_triangle_points(self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int,
+                              color: rl.Color):
+        """Draw a triangle through reusable Vector2 points"""
+        v1, v2, v3 = self._triangle
+        v1.x, v1.y = x1, y1
+        v2.x, v2.y = x2, y2
+        v3.x, v3.y = x3, y3
+        rl.draw_triangle(v1, v2, v3, color)
+    
+    @staticmethod
+    def is_point_in_rect(x: int, y: int, rect_x: int, rect_y: int, 
                          rect_width: int, rect_height: int) -> bool:
-        """Check if a point is inside a rectangle"""
-        return (x >= rect_x and x <= rect_x + rect_width and 
-                y >= rect_y and y <= rect_y + rect_height)
+        """Check if a point is inside a rectangle (right and bottom edges excluded)"""
+        return (rect_x <= x < rect_x + rect_width and
+                rect_y <= y < rect_y + rect_height)
+    
+    def _widget_id(self, kind: str, name: str, x: Optional[int] = None, y: Optional[int] = None) -> str:
+        """Return the interned ID string for a widget, building it only once"""
+        key = (kind, name, x, y)
+        widget_id = self._id_cache.get(key)
+        if widget_id is None:
+            text = f"{kind}_{name}" if x is None else f"{kind}_{name}_{x}_{y}"
+            widget_id = self._id_cache[key] = sys.intern(text)
+        return widget_id
+    
+    def _measure_text(self, text: str, font_size: int) -> int:
+        """Measure text width, caching results across frames"""
+        key = (text, font_size)
+        width = self._text_width_cache.get(key)
+        if width is None:
+            # Bound the cache when many one-off strings are measured
+            if len(self._text_width_cache) >= TEXT_WIDTH_CACHE_SIZE:
+                self._text_width_cache.clear()
+            width = self._text_width_cache[key] = rl.measure_text(text, font_size)
+        return width
     
     def button(self, label: str, x: int, y: int, width: int, height: int, 
               is_selected: bool = False) -> bool:
@@ -140,11 +401,11 @@ class UI:
             True if the button was clicked
         """
         # Generate a unique ID for this button
-        button_id = f"button_{label}_{x}_{y}"
+        button_id = self._widget_id("button", label, x, y)
         
         # Check if mouse is over the button
-        mouse_over = self.is_point_in_rect(
-            self.mouse_pos[0], self.mouse_pos[1], 
+        mouse_over = self._mouse_in_panel[-1] and self.is_point_in_rect(
+            self.mouse_x, self.mouse_y, 
             x, y, width, height
         )
         
@@ -153,26 +414,34 @@ class UI:
             self.hot_item = button_id
             
         # Determine button color
-        color = self.colors["button"]
+        color = self._col_button
         if is_selected:
-            color = self.colors["button_active"]
+            color = self._col_button_active
         elif self.hot_item == button_id:
-            color = self.colors["button_hover"]
+            color = self._col_button_hover
         
         # Draw button
-        rl.draw_rectangle(x, y, width, height, color)
-        rl.draw_rectangle_lines(x, y, width, height, self.colors["panel_border"])
-        
-        # Calculate text position to center in button
-        text_width = rl.measure_text(label, self.font_size)
-        text_x = x + (width - text_width) // 2
-        text_y = y + (height - self.font_size) // 2
+        self._draw_framed_rect(x, y, width, height, color, self._col_panel_border)
+        
+        # Calculate text position to center in button, reusing the result
+        # from earlier frames while the button's geometry is unchanged
+        layout_key = (label, self.font_size, x, y, width, height)
+        text_pos = self._layout_cache.get(layout_key)
+        if text_pos is None:
+            if len(self._layout_cache) >= LAYOUT_CACHE_SIZE:
+                self._layout_cache.clear()
+            text_width = self._measure_text(label, self.font_size)
+            text_pos = self._layout_cache[layout_key] = (
+                x + (width - text_width) // 2,
+                y + (height - self.font_size) // 2
+            )
+        text_x, text_y = text_pos
         
         # Draw text
-        rl.draw_text(label, text_x, text_y, self.font_size, self.colors["button_text"])
+        self._draw_text(label, text_x, text_y, self.font_size, self._col_button_text)
         
         # Return true if button was clicked
-        return mouse_over and rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT)
+        return mouse_over and self.mouse_released
     
     def label(self, text: str, x: int, y: int, font_size: Optional[int] = None):
         """
@@ -184,7 +453,7 @@ class UI:
             font_size: Optional custom font size
         """
         size = font_size if font_size is not None else self.font_size
-        rl.draw_text(text, x, y, size, self.colors["label"])
+        self._draw_text(text, x, y, size, self._col_label)
     
     def slider(self, id_str: str, x: int, y: int, width: int, height: int, 
               min_val: float, max_val: float, default_val: Optional[float] = None) -> float:
@@ -201,84 +470,25 @@ class UI:
         Returns:
             Current slider value
         """
-        # Initialize slider value if not exists
-        if id_str not in self.slider_values:
-            self.slider_values[id_str] = default_val if default_val is not None else min_val
-        
-        # Get current value
-        value = self.slider_values[id_str]
-        
-        # Calculate slider parameters
-        slider_id = f"slider_{id_str}"
-        normalized_value = (value - min_val) / (max_val - min_val)
-        knob_pos = int(x + normalized_value * width)
-        knob_radius = height
-        
-        # Check if mouse is over the knob
-        mouse_over_knob = self.is_point_in_rect(
-            self.mouse_pos[0], self.mouse_pos[1],
-            knob_pos - knob_radius, y - knob_radius // 2,
-            knob_radius * 2, knob_radius * 2
-        )
-        
-        # Set hot item if mouse is over
-        if mouse_over_knob:
-            self.hot_item = slider_id
-        
-        # Update drag state
-        if self.active_item == slider_id and rl.is_mouse_button_down(rl.MOUSE_BUTTON_LEFT):
-            self.dragging_slider = slider_id
-            
-        # Update value if dragging
-        if self.dragging_slider == slider_id:
-            mouse_x = self.mouse_pos[0]
-            normalized_pos = max(0, min(1, (mouse_x - x) / width))
-            self.slider_values[id_str] = min_val + normalized_pos * (max_val - min_val)
-        
-        # Draw slider background
-        rl.draw_rectangle(x, y, width, height, self.colors["slider_bg"])
-        
-        # Draw slider progress
-        rl.draw_rectangle(x, y, int(normalized_value * width), height, 
-                        self.colors["slider_active" if self.dragging_slider == slider_id else "slider_knob"])
-        
-        # Draw knob
-        knob_color = self.colors["slider_active"] if self.dragging_slider == slider_id else self.colors["slider_knob"]
-        rl.draw_circle(knob_pos, y + height // 2, knob_radius, knob_color)
-        
-        return self.slider_values[id_str]
-    
-    def slider(self, id_str: str, x: int, y: int, width: int, height: int, 
-              min_val: float, max_val: float, default_val: Optional[float] = None) -> float:
-        """
-        Draw a slider and return its value
+        slider_id = self._widget_id("slider", id_str)
         
-        Args:
-            id_str: Unique identifier for this slider
-            x, y: Slider position
-            width, height: Slider size
-            min_val, max_val: Value range
-            default_val: Optional default value
-            
-        Returns:
-            Current slider value
-        """
         # Initialize slider value if not exists
-        if id_str not in self.slider_values:
-            self.slider_values[id_str] = default_val if default_val is not None else min_val
+        slot = self._state_index.get(slider_id)
+        if slot is None:
+            slot = self._state_index[slider_id] = len(self._slider_state)
+            self._slider_state.append(default_val if default_val is not None else min_val)
         
         # Get current value
-        value = self.slider_values[id_str]
+        value = self._slider_state[slot]
         
         # Calculate slider parameters
-        slider_id = f"slider_{id_str}"
         normalized_value = (value - min_val) / (max_val - min_val)
         knob_pos = int(x + normalized_value * width)
         knob_radius = height
         
         # Check if mouse is over the knob
         mouse_over_knob = self.is_point_in_rect(
-            self.mouse_pos[0], self.mouse_pos[1],
+            self.mouse_x, self.mouse_y,
             knob_pos - knob_radius, y - knob_radius // 2,
             knob_radius * 2, knob_radius * 2
         )
@@ -288,27 +498,31 @@ class UI:
             self.hot_item = slider_id
         
         # Update drag state
-        if self.active_item == slider_id and rl.is_mouse_button_down(rl.MOUSE_BUTTON_LEFT):
+        if self.active_item == slider_id and self.mouse_down:
             self.dragging_slider = slider_id
             
         # Update value if dragging
         if self.dragging_slider == slider_id:
-            mouse_x = self.mouse_pos[0]
-            normalized_pos = max(0, min(1, (mouse_x - x) / width))
-            self.slider_values[id_str] = min_val + normalized_pos * (max_val - min_val)
+            normalized_pos = (self.mouse_x - x) / width
+            if normalized_pos < 0.0:
+                normalized_pos = 0.0
+            elif normalized_pos > 1.0:
+                normalized_pos = 1.0
+            self._slider_state[slot] = min_val + normalized_pos * (max_val - min_val)
+        
+        knob_color = self._col_slider_active if self.dragging_slider == slider_id else self._col_slider_knob
         
         # Draw slider background
-        rl.draw_rectangle(x, y, width, height, self.colors["slider_bg"])
+        self._draw_shape(rl.draw_rectangle, x, y, width, height, self._col_slider_bg)
         
         # Draw slider progress
-        rl.draw_rectangle(x, y, int(normalized_value * width), height, 
-                        self.colors["slider_active" if self.dragging_slider == slider_id else "slider_knob"])
+        self._draw_shape(rl.draw_rectangle, x, y, int(normalized_value * width), height, 
+                        knob_color)
         
         # Draw knob
-        knob_color = self.colors["slider_active"] if self.dragging_slider == slider_id else self.colors["slider_knob"]
-        rl.draw_circle(knob_pos, y + height // 2, knob_radius, knob_color)
+        self._draw_shape(rl.draw_circle, knob_pos, y + height // 2, knob_radius, knob_color)
         
-        return self.slider_values[id_str]
+        return self._slider_state[slot]
     
     def slider_with_label(self, label: str, id_str: str, x: int, y: int, width: int, 
                          min_val: float, max_val: float, default_val: Optional[float] = None, 
@@ -330,7 +544,7 @@ class UI:
         """
         # Draw label
         self.label(label, x, y)
-        y += self.font_size + 5
+        y += self._title_h
         
         # Calculate slider dimensions
         slider_width = width - 60  # Reserve space for value display
@@ -341,7 +555,7 @@ class UI:
         
         # Draw value
         value_text = format_str.format(value)
-        rl.draw_text(value_text, x + slider_width + 10, y, self.font_size, self.colors["slider_text"])
+        self._draw_text(value_text, x + slider_width + 10, y, self.font_size, self._col_slider_text)
         
         return value
     
@@ -360,22 +574,21 @@ class UI:
         Returns:
             Currently selected index
         """
-        dropdown_id = f"dropdown_{id_str}"
+        dropdown_id = self._widget_id("dropdown", id_str)
         
         # Store selected index
-        if not hasattr(self, 'dropdown_selections'):
-            self.dropdown_selections = {}
-        
-        if dropdown_id not in self.dropdown_selections:
-            self.dropdown_selections[dropdown_id] = selected_index
+        slot = self._state_index.get(dropdown_id)
+        if slot is None:
+            slot = self._state_index[dropdown_id] = len(self._dropdown_state)
+            self._dropdown_state.append(selected_index)
         
         # Get current selection
-        current_selection = self.dropdown_selections[dropdown_id]
+        current_selection = self._dropdown_state[slot]
         selected_text = options[current_selection] if options else "No options"
         
         # Check if mouse is over the dropdown
-        mouse_over = self.is_point_in_rect(
-            self.mouse_pos[0], self.mouse_pos[1],
+        mouse_over = self._mouse_in_panel[-1] and self.is_point_in_rect(
+            self.mouse_x, self.mouse_y,
             x, y, width, height
         )
         
@@ -384,64 +597,73 @@ class UI:
             self.hot_item = dropdown_id
         
         # Draw dropdown box
-        rl.draw_rectangle(x, y, width, height, self.colors["dropdown_bg"])
-        rl.draw_rectangle_lines(x, y, width, height, self.colors["dropdown_border"])
+        self._draw_framed_rect(x, y, width, height, self._col_dropdown_bg, self._col_dropdown_border)
         
         # Draw selected text
         text_y = y + (height - self.font_size) // 2
-        rl.draw_text(selected_text, x + 10, text_y, self.font_size, self.colors["dropdown_text"])
+        self._draw_text(selected_text, x + 10, text_y, self.font_size, self._col_dropdown_text)
         
         # Draw dropdown arrow - PyRay uses Vector2 differently
         arrow_x = x + width - 20
         arrow_y = y + height // 2
         
-        # Create Vector2 points for triangle
-        v1 = rl.Vector2(arrow_x, arrow_y - 5)
-        v2 = rl.Vector2(arrow_x + 10, arrow_y - 5)
-        v3 = rl.Vector2(arrow_x + 5, arrow_y + 5)
-        
         # Draw triangle
-        rl.draw_triangle(v1, v2, v3, self.colors["dropdown_text"])
+        self._draw_shape(self._draw_triangle_points,
+                         arrow_x, arrow_y - 5,
+                         arrow_x + 10, arrow_y - 5,
+                         arrow_x + 5, arrow_y + 5,
+                         self._col_dropdown_text)
         
         # Handle dropdown opening/closing
-        if mouse_over and rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT):
+        if mouse_over and self.mouse_released:
             if self.open_dropdown == dropdown_id:
                 self.open_dropdown = None
             else:
                 self.open_dropdown = dropdown_id
         
-        # Draw dropdown list if open
+        # Draw dropdown list if open, above all other widgets
         if self.open_dropdown == dropdown_id and options:
-            dropdown_height = len(options) * (self.font_size + 10)
-            rl.draw_rectangle(x, y + height, width, dropdown_height, self.colors["dropdown_bg"])
-            rl.draw_rectangle_lines(x, y + height, width, dropdown_height, self.colors["dropdown_border"])
+            row_height, option_ys = self._dropdown_rows(dropdown_id, options, y + height)
+            dropdown_height = len(options) * row_height
+            self._draw_framed_rect(x, y + height, width, dropdown_height,
+                                   self._col_dropdown_bg, self._col_dropdown_border, overlay=True)
             
             # Draw options
-            for i, option in enumerate(options):
-                option_y = y + height + i * (self.font_size + 10)
-                option_rect = (x, option_y, width, self.font_size + 10)
-                
+            mouse_x, mouse_y = self.mouse_x, self.mouse_y
+            for i, (option, option_y) in enumerate(zip(options, option_ys)):
                 # Check if mouse is over this option
-                mouse_over_option = self.is_point_in_rect(
-                    self.mouse_pos[0], self.mouse_pos[1],
-                    x, option_y, width, self.font_size + 10
-                )
+                mouse_over_option = (x <= mouse_x < x + width and
+                                     option_y <= mouse_y < option_y + row_height)
                 
                 # Draw option background
                 if mouse_over_option:
-                    rl.draw_rectangle(x, option_y, width, self.font_size + 10, self.colors["dropdown_item_hover"])
+                    self._draw_shape(rl.draw_rectangle, x, option_y, width, row_height,
+                                     self._col_dropdown_item_hover, overlay=True)
                 elif i == current_selection:
-                    rl.draw_rectangle(x, option_y, width, self.font_size + 10, self.colors["dropdown_item"])
+                    self._draw_shape(rl.draw_rectangle, x, option_y, width, row_height,
+                                     self._col_dropdown_item, overlay=True)
                 
                 # Draw option text
-                rl.draw_text(option, x + 10, option_y + 5, self.font_size, self.colors["dropdown_text"])
+                self._draw_text(option, x + 10, option_y + 5, self.font_size,
+                                self._col_dropdown_text, overlay=True)
                 
                 # Handle option selection
-                if mouse_over_option and rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT):
-                    self.dropdown_selections[dropdown_id] = i
+                if mouse_over_option and self.mouse_released:
+                    self._dropdown_state[slot] = i
                     self.open_dropdown = None
         
-        return self.dropdown_selections[dropdown_id]
+        return self._dropdown_state[slot]
+    
+    def _dropdown_rows(self, dropdown_id: str, options: List[str],
+                       list_y: int) -> Tuple[int, Tuple[int, ...]]:
+        """Return the row height and option row y positions for an open dropdown"""
+        key = (id(options), len(options), list_y, self.font_size)
+        geom = self._dropdown_geom.get(dropdown_id)
+        if geom is None or geom[0] != key:
+            row_height = self._row_h
+            option_ys = tuple(list_y + i * row_height for i in range(len(options)))
+            geom = self._dropdown_geom[dropdown_id] = (key, row_height, option_ys)
+        return geom[1], geom[2]
     
     def dropdown_with_label(self, label: str, id_str: str, x: int, y: int, width: int, 
                            options: List[str], selected_index: int = 0) -> int:
@@ -461,7 +683,7 @@ class UI:
         """
         # Draw label
         self.label(label, x, y)
-        y += self.font_size + 5
+        y += self._title_h
         
         # Draw dropdown
         return self.dropdown(id_str, x, y, width, 30, options, selected_index)
@@ -479,24 +701,23 @@ class UI:
         Returns:
             Current checkbox state (checked or not)
         """
-        checkbox_id = f"checkbox_{id_str}"
+        checkbox_id = self._widget_id("checkbox", id_str)
         
         # Store checkbox state
-        if not hasattr(self, 'checkbox_states'):
-            self.checkbox_states = {}
-        
-        if checkbox_id not in self.checkbox_states:
-            self.checkbox_states[checkbox_id] = checked
+        slot = self._state_index.get(checkbox_id)
+        if slot is None:
+            slot = self._state_index[checkbox_id] = len(self._checkbox_state)
+            self._checkbox_state.append(checked)
         
         # Get current state
-        is_checked = self.checkbox_states[checkbox_id]
+        is_checked = self._checkbox_state[slot]
         
         # Calculate dimensions
         box_size = self.font_size
         
         # Check if mouse is over the checkbox
-        mouse_over = self.is_point_in_rect(
-            self.mouse_pos[0], self.mouse_pos[1],
+        mouse_over = self._mouse_in_panel[-1] and self.is_point_in_rect(
+            self.mouse_x, self.mouse_y,
             x, y, box_size + self.font_size * len(label), box_size
         )
         
@@ -505,31 +726,26 @@ class UI:
             self.hot_item = checkbox_id
         
         # Handle click
-        if mouse_over and rl.is_mouse_button_released(rl.MOUSE_BUTTON_LEFT):
-            self.checkbox_states[checkbox_id] = not is_checked
-            is_checked = self.checkbox_states[checkbox_id]
+        if mouse_over and self.mouse_released:
+            is_checked = self._checkbox_state[slot] = not is_checked
         
         # Draw checkbox
-        if is_checked:
-            rl.draw_rectangle(x, y, box_size, box_size, self.colors["button_active"])
-        else:
-            rl.draw_rectangle(x, y, box_size, box_size, self.colors["button"])
-        
-        rl.draw_rectangle_lines(x, y, box_size, box_size, self.colors["panel_border"])
+        box_color = self._col_button_active if is_checked else self._col_button
+        self._draw_framed_rect(x, y, box_size, box_size, box_color, self._col_panel_border)
         
         # Draw checkmark if checked
         if is_checked:
             # Simple checkmark
-            rl.draw_line(x + 3, y + box_size // 2, 
+            self._draw_shape(rl.draw_line, x + 3, y + box_size // 2, 
                         x + box_size // 2 - 2, y + box_size - 3, 
-                        self.colors["button_text"])
-            rl.draw_line(x + box_size // 2 - 2, y + box_size - 3, 
+                        self._col_button_text)
+            self._draw_shape(rl.draw_line, x + box_size // 2 - 2, y + box_size - 3, 
                         x + box_size - 3, y + 3, 
-                        self.colors["button_text"])
+                        self._col_button_text)
         
         # Draw label
-        rl.draw_text(label, x + box_size + 5, y + (box_size - self.font_size) // 2, 
-                   self.font_size, self.colors["label"])
+        self._draw_text(label, x + box_size + 5, y + (box_size - self.font_size) // 2, 
+                   self.font_size, self._col_label)
         
         return is_checked
     
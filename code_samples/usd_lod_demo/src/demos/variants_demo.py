@@ -7,16 +7,262 @@ of entire subsystems.
 """
 
 import os
+from bisect import bisect_right
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
 
+import numpy as np
 import pyray as rl
 
 from pxr import Usd, UsdGeom, Sdf, Gf, Tf
 
 from demo_framework.app import Demo
+from demo_framework.renderer import Renderer
 from usd_utils.usd_helpers import UsdHelpers
 
+class LOD(IntEnum):
+    """Enemy LODs from most to least detailed, indexing the per-LOD tables"""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
+# Variant names of the LODs, indexed by LOD
+_LOD_ORDER = tuple(lod.name.lower() for lod in LOD)
+
+# Label text that only depends on the LOD, built once and indexed by LOD
+_ENEMY_LABELS = tuple(f"Enemy ({name.upper()})" for name in _LOD_ORDER)
+_CURRENT_LOD_LABELS = tuple(f"Current LOD: {name.upper()}" for name in _LOD_ORDER)
+_LOD_BUTTON_LABELS = tuple(name.upper() for name in _LOD_ORDER)
+
+# Threshold sliders as (LOD, label, slider ID)
+_THRESHOLD_SLIDERS = tuple(
+    (lod, f"{lod.capitalize()} LOD Threshold", f"threshold_{lod}") for lod in ("high", "medium")
+)
+
+
+class _LodDisplay(NamedTuple):
+    """What the subsystem visualization shows for one LOD"""
+    polygons_label: str
+    mesh_size: Tuple[float, float, float]
+    mesh_color: Tuple[int, int, int, int]
+    joints_label: str
+    ai_label: str
+    depth_label: str
+    collision_label: str
+    # Renderer method drawing the collision shape, its height above the
+    # enemy origin and its size arguments
+    collision_draw: Callable[..., None]
+    collision_y: float
+    collision_dims: Tuple[float, ...]
+
+
+# Subsystem visualization, indexed by LOD
+_LOD_DISPLAY = (
+    # HIGH
+    _LodDisplay(
+        "Polygons: 10,000", (2.0, 4.0, 2.0), (0, 150, 255, 100),
+        "Joints: 80", "Complex AI", "Depth: 5",
+        "Collision: perBone", Renderer.draw_box, 1.0, ((1.1, 2.1, 1.1),)
+    ),
+    # MEDIUM
+    _LodDisplay(
+        "Polygons: 3,000", (1.9, 3.9, 1.9), (0, 200, 100, 100),
+        "Joints: 30", "Basic AI", "Depth: 3",
+        "Collision: capsule", Renderer.draw_cylinder, 0.0, (0.6, 3.0)
+    ),
+    # LOW
+    _LodDisplay(
+        "Polygons: 500", (1.8, 3.8, 1.8), (255, 200, 0, 100),
+        "Joints: 10", "Stationary AI", "Depth: 1",
+        "Collision: simple", Renderer.draw_sphere, 1.0, (1.0,)
+    ),
+)
+
+# Color of the collision shape outline at every LOD
+_COLLISION_COLOR = (200, 50, 50, 100)
+
+# Enemy subsystem scopes, authored once outside the LOD variants
+_ENEMY_SCOPES = ("Appearance", "Animation", "Behavior", "Physics")
+
+# Abstract prim holding the subsystem prototypes the LOD variants reference
+_PROTOTYPES_PATH = "/Root/_Prototypes"
+
+# Subsystem prototypes as (name, prim type, attributes), each attribute being
+# (name, value, value type, custom)
+_ENEMY_PROTOTYPES = (
+    # Appearance - detail meshes
+    ("HighDetailMesh", "Cube", (
+        ("size", 2.0, "double", False),
+        ("polygons", 10000, "int", True),
+    )),
+    ("MediumDetailMesh", "Cube", (
+        ("size", 1.9, "double", False),
+        ("polygons", 3000, "int", True),
+    )),
+    ("LowDetailMesh", "Cube", (
+        ("size", 1.8, "double", False),
+        ("polygons", 500, "int", True),
+    )),
+    # Animation - skeletons
+    ("FullSkeleton", "Xform", (
+        ("joints", 80, "int", True),
+    )),
+    ("MediumSkeleton", "Xform", (
+        ("joints", 30, "int", True),
+    )),
+    ("LowSkeleton", "Xform", (
+        ("joints", 10, "int", True),
+    )),
+    # Behavior - AI behavior trees
+    ("FullBehaviorTree", "Xform", (
+        ("sparkle:ai:type", "complex", "string", True),
+        ("sparkle:ai:maxDecisionDepth", 5, "int", True),
+        ("sparkle:ai:patrolPath", "/Level/Paths/ComplexPatrol", "string", True),
+    )),
+    ("SimplifiedBehaviorTree", "Xform", (
+        ("sparkle:ai:type", "basic", "string", True),
+        ("sparkle:ai:maxDecisionDepth", 3, "int", True),
+        ("sparkle:ai:patrolPath", "/Level/Paths/SimplePatrol", "string", True),
+    )),
+    ("MinimalBehaviorTree", "Xform", (
+        ("sparkle:ai:type", "stationary", "string", True),
+        ("sparkle:ai:maxDecisionDepth", 1, "int", True),
+    )),
+    # Physics - collision setups
+    ("DetailedPhysics", "Xform", (
+        ("sparkle:physics:collisionType", "perBone", "string", True),
+        ("sparkle:physics:collisionMesh", "/Enemy/Appearance/HighDetailMesh", "string", True),
+    )),
+    ("SimplifiedPhysics", "Xform", (
+        ("sparkle:physics:collisionType", "capsule", "string", True),
+        ("sparkle:physics:collisionMesh", "/Enemy/Appearance/MediumDetailMesh", "string", True),
+    )),
+    ("MinimalPhysics", "Xform", (
+        ("sparkle:physics:collisionType", "simple", "string", True),
+    )),
+)
+
+# Prototypes each LOD variant references, as (scope, prototype name)
+_LOD_PROTOTYPES = {
+    "high": (("Appearance", "HighDetailMesh"), ("Animation", "FullSkeleton"),
+             ("Behavior", "FullBehaviorTree"), ("Physics", "DetailedPhysics")),
+    "medium": (("Appearance", "MediumDetailMesh"), ("Animation", "MediumSkeleton"),
+               ("Behavior", "SimplifiedBehaviorTree"), ("Physics", "SimplifiedPhysics")),
+    "low": (("Appearance", "LowDetailMesh"), ("Animation", "LowSkeleton"),
+            ("Behavior", "MinimalBehaviorTree"), ("Physics", "MinimalPhysics")),
+}
+
+def _usda_value(value) -> str:
+    """Format an attribute value as usda text"""
+    return f'"{value}"' if isinstance(value, str) else repr(value)
+
+
+def _build_enemy_usda() -> str:
+    """Build the usda document for the enemy, its prototypes and its LOD variants"""
+    lines = [
+        "#usda 1.0",
+        "",
+        'over "Root"',
+        "{",
+        '    def Xform "Enemy" (',
+        "        variants = {",
+        f'            string complexityLOD = "{_LOD_ORDER[0]}"',
+        "        }",
+        '        prepend variantSets = "complexityLOD"',
+        "    )",
+        "    {",
+        '        custom string sparkle:entity:id = "goblin_01"',
+    ]
+    
+    # Subsystem scopes shared by every LOD
+    for scope in _ENEMY_SCOPES:
+        lines.append(f'        def Xform "{scope}"')
+        lines.append("        {")
+        lines.append("        }")
+    
+    # Each LOD variant only references its prototypes into the scopes
+    lines.append('        variantSet "complexityLOD" = {')
+    for lod in _LOD_ORDER:
+        lines.append(f'            "{lod}" {{')
+        for scope, name in _LOD_PROTOTYPES[lod]:
+            lines.append(f'                over "{scope}"')
+            lines.append("                {")
+            lines.append(f'                    def "{name}" (')
+            lines.append(f"                        prepend references = <{_PROTOTYPES_PATH}/{name}>")
+            lines.append("                    )")
+            lines.append("                    {")
+            lines.append("                    }")
+            lines.append("                }")
+        lines.append("            }")
+    lines.append("        }")
+    lines.append("    }")
+    
+    # Subsystem prototypes, abstract so they are not drawn or traversed
+    lines.append(f'    class Xform "{_PROTOTYPES_PATH.rsplit("/", 1)[1]}"')
+    lines.append("    {")
+    for name, type_name, attributes in _ENEMY_PROTOTYPES:
+        lines.append(f'        def {type_name} "{name}"')
+        lines.append("        {")
+        for attr_name, value, value_type, custom in attributes:
+            prefix = "custom " if custom else ""
+            lines.append(f"            {prefix}{value_type} {attr_name} = {_usda_value(value)}")
+        lines.append("        }")
+    lines.append("    }")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Solid animation, behavior and physics subsystem markers: unit mesh kind,
+# scale as for Renderer.add_static(), and label
+_SUBSYSTEM_KINDS = ("cylinder", "sphere", "cube")
+_SUBSYSTEM_SCALES = np.array([[0.5, 3.0, 0.5], [1.0, 1.0, 1.0], [1.0, 2.0, 1.0]], dtype=np.float32)
+_SUBSYSTEM_LABELS = ("Animation", "AI", "Physics")
+
+# Offsets from the enemy origin of everything _render_subsystems() draws,
+# turned into world positions with one vectorized add per frame
+_RENDER_OFFSETS = np.array([
+    [-3.0, 0.0, 0.0],   # Animation marker (cylinder base)
+    [3.0, 1.5, 0.0],    # AI marker
+    [0.0, 1.0, 3.0],    # Physics marker
+    [-3.0, 1.5, 0.0],   # Animation marker label
+    [3.0, 1.5, 0.0],    # AI marker label
+    [0.0, 1.0, 3.0],    # Physics marker label
+    [0.0, 0.0, 0.0],    # Detail mesh outline
+    [0.0, 3.5, 0.0],    # Polygons label
+    [-3.0, 3.5, 0.0],   # Joints label
+    [3.0, 3.0, 0.0],    # AI type label
+    [3.0, 3.5, 0.0],    # Decision depth label
+    [0.0, 3.5, 3.0],    # Collision label
+    [0.0, 0.0, 3.0],    # Collision shape, raised by the LOD's collision_y
+    [0.0, 5.0, 0.0],    # Camera distance label
+], dtype=np.float32)
+
+# Rows of _RENDER_OFFSETS holding the subsystem detail labels, and their text
+# per LOD in the same order, indexed by LOD
+_DETAIL_LABEL_ROWS = slice(7, 12)
+_DETAIL_LABELS = tuple(
+    (d.polygons_label, d.joints_label, d.ai_label, d.depth_label, d.collision_label)
+    for d in _LOD_DISPLAY
+)
+
+# Box around the enemy and everything drawn for its subsystems, including
+# labels, relative to the enemy's origin
+_ENEMY_BOUNDS_CENTER = (0.0, 1.75, 1.5)
+_ENEMY_BOUNDS_HALF_EXTENT = (4.0, 3.75, 2.5)
+
+# Fraction of a threshold the camera distance must pass it by before the LOD
+# switches. Without it, a camera resting on a threshold would reselect the
+# variant, and recompose the enemy, every frame
+LOD_HYSTERESIS = 0.05
+
+
+# usda text of the enemy, built once at import
+_ENEMY_USDA = _build_enemy_usda()
+
+
 class VariantsDemo(Demo):
     """Demonstrates LOD using USD variants"""
     
@@ -24,10 +270,36 @@ class VariantsDemo(Demo):
         super().__init__(app)
         self.stage = None
         self.enemy_prim = None
+        self._enemy_layer = None
         self.camera_distance = 10.0
-        self.current_lod = "high"
+        
+        # Camera distance text, rebuilt only when the shown tenths change
+        self._distance_tenths = None
+        self._distance_label = ""
+        self.current_lod = LOD.HIGH
         self.auto_lod = True
         
+        # LOD requested by auto LOD or the UI, applied to the stage at a single
+        # point in update() rather than wherever it was requested
+        self._pending_variant: Optional[LOD] = None
+        
+        # Enemy world position, refreshed once per frame in update() through
+        # a transform cache kept across frames. Nothing in this demo moves
+        # the enemy; anything that does must clear the cache
+        self._cached_world_pos = (0.0, 0.0, 0.0)
+        self._xform_cache = None
+        
+        # Renderer colors used every frame, bound in initialize(); the LOD
+        # colors are indexed by LOD
+        self._lod_colors = ()
+        self._animation_color = None
+        self._ai_color = None
+        self._physics_color = None
+        self._subsystem_colors = ()
+        
+        # World positions of _RENDER_OFFSETS, rewritten every frame
+        self._render_positions = np.zeros_like(_RENDER_OFFSETS)
+        
         # Define LOD distance thresholds
         self.lod_thresholds = {
             "high": 5.0,
@@ -35,6 +307,16 @@ class VariantsDemo(Demo):
             "low": 20.0
         }
         
+        # Upper distance bounds of the high and medium LODs, kept ascending
+        # for bisect; rebuilt whenever a threshold changes. The near and far
+        # copies are pulled in and pushed out by the hysteresis band for
+        # switching to more and less detail respectively, and squared to
+        # compare against the squared camera distance
+        self._lod_bounds = [0.0, 0.0]
+        self._lod_bounds_near_sq = [0.0, 0.0]
+        self._lod_bounds_far_sq = [0.0, 0.0]
+        self._update_lod_bounds()
+        
     def initialize(self):
         """Initialize the demo"""
         if self.initialized:
@@ -46,6 +328,31 @@ class VariantsDemo(Demo):
         assets_dir = self.app.assets_path / "enemy"
         assets_dir.mkdir(exist_ok=True, parents=True)
         
+        # Create the stage and the enemy
+        self._build_stage()
+        
+        # Initialize camera position
+        self.app.camera.position = rl.Vector3(0.0, 5.0, 10.0)
+        self.app.camera.target = rl.Vector3(0.0, 2.0, 0.0)
+        
+        # Resolve the static color mappings once
+        self._lod_colors = tuple(self.renderer.lod_colors[name] for name in _LOD_ORDER)
+        self._animation_color = self.renderer.system_colors["behavior"]
+        self._ai_color = self.renderer.system_colors["physics"]
+        self._physics_color = self.renderer.system_colors["visual"]
+        self._subsystem_colors = (self._animation_color, self._ai_color, self._physics_color)
+        
+        # The enemy never moves, so its subsystem markers are registered once
+        # and drawn by the renderer every frame
+        marker_positions = np.add(_RENDER_OFFSETS[:3], self._cached_world_pos).tolist()
+        for kind, position, scale, color in zip(_SUBSYSTEM_KINDS, marker_positions,
+                                                _SUBSYSTEM_SCALES.tolist(), self._subsystem_colors):
+            self.renderer.add_static(kind, position, scale, color)
+        
+        self.initialized = True
+    
+    def _build_stage(self):
+        """Create the USD stage and the enemy with its LOD variants"""
         # Create USD stage
         self.stage = UsdHelpers.create_stage()
         
@@ -54,358 +361,154 @@ class VariantsDemo(Demo):
         
         # Create enemy prim with LOD variants
         self.create_enemy()
-        
-        # Initialize camera position
-        self.app.camera.position = rl.Vector3(0.0, 5.0, 10.0)
-        self.app.camera.target = rl.Vector3(0.0, 2.0, 0.0)
-        
-        self.initialized = True
+        self._xform_cache = UsdGeom.XformCache()
+        self._cached_world_pos = UsdHelpers.get_world_position_cached(self.enemy_prim, self._xform_cache)
     
     def create_enemy(self):
         """Create enemy prim with LOD variants"""
-        # Create enemy prim
-        enemy = UsdHelpers.create_xform(self.stage, "/Root/Enemy")
-        self.enemy_prim = enemy.GetPrim()
-        
-        # Add custom attributes
-        UsdHelpers.add_custom_attribute(self.enemy_prim, "sparkle:entity:id", "goblin_01", "string")
-        
-        # Create LOD variant set
-        UsdHelpers.create_variant_set(
-            self.enemy_prim,
-            "complexityLOD",
-            ["high", "medium", "low"],
-            "high"
-        )
-        
-        # Define high LOD variant
-        def create_high_lod():
-            # Appearance - High detail mesh
-            appearance = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Appearance")
-            high_mesh = UsdHelpers.create_cube(self.stage, "/Root/Enemy/Appearance/HighDetailMesh", 2.0)
-            
-            # Add custom attributes to indicate this is high detail
-            UsdHelpers.add_custom_attribute(high_mesh.GetPrim(), "polygons", 10000, "int")
-            
-            # Animation - Full skeleton
-            animation = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation")
-            skeleton = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation/FullSkeleton")
-            UsdHelpers.add_custom_attribute(skeleton.GetPrim(), "joints", 80, "int")
-            
-            # Behavior - Full AI behavior
-            behavior = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior")
-            ai = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior/FullBehaviorTree")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:type", "complex", "string")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:maxDecisionDepth", 5, "int")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:patrolPath", "/Level/Paths/ComplexPatrol", "string")
-            
-            # Physics - Detailed physics
-            physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics")
-            detailed_physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics/DetailedPhysics")
-            UsdHelpers.add_custom_attribute(detailed_physics.GetPrim(), "sparkle:physics:collisionType", "perBone", "string")
-            UsdHelpers.add_custom_attribute(detailed_physics.GetPrim(), "sparkle:physics:collisionMesh", "/Enemy/Appearance/HighDetailMesh", "string")
-        
-        # Define medium LOD variant
-        def create_medium_lod():
-            # Appearance - Medium detail mesh
-            appearance = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Appearance")
-            medium_mesh = UsdHelpers.create_cube(self.stage, "/Root/Enemy/Appearance/MediumDetailMesh", 1.9)
-            
-            # Add custom attributes to indicate this is medium detail
-            UsdHelpers.add_custom_attribute(medium_mesh.GetPrim(), "polygons", 3000, "int")
-            
-            # Animation - Simplified skeleton
-            animation = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation")
-            skeleton = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation/MediumSkeleton")
-            UsdHelpers.add_custom_attribute(skeleton.GetPrim(), "joints", 30, "int")
-            
-            # Behavior - Reduced AI behavior
-            behavior = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior")
-            ai = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior/SimplifiedBehaviorTree")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:type", "basic", "string")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:maxDecisionDepth", 3, "int")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:patrolPath", "/Level/Paths/SimplePatrol", "string")
-            
-            # Physics - Simplified physics
-            physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics")
-            simplified_physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics/SimplifiedPhysics")
-            UsdHelpers.add_custom_attribute(simplified_physics.GetPrim(), "sparkle:physics:collisionType", "capsule", "string")
-            UsdHelpers.add_custom_attribute(simplified_physics.GetPrim(), "sparkle:physics:collisionMesh", "/Enemy/Appearance/MediumDetailMesh", "string")
-        
-        # Define low LOD variant
-        def create_low_lod():
-            # Appearance - Low detail mesh
-            appearance = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Appearance")
-            low_mesh = UsdHelpers.create_cube(self.stage, "/Root/Enemy/Appearance/LowDetailMesh", 1.8)
-            
-            # Add custom attributes to indicate this is low detail
-            UsdHelpers.add_custom_attribute(low_mesh.GetPrim(), "polygons", 500, "int")
-            
-            # Animation - Minimal skeleton
-            animation = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation")
-            skeleton = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Animation/LowSkeleton")
-            UsdHelpers.add_custom_attribute(skeleton.GetPrim(), "joints", 10, "int")
-            
-            # Behavior - Minimal AI behavior
-            behavior = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior")
-            ai = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Behavior/MinimalBehaviorTree")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:type", "stationary", "string")
-            UsdHelpers.add_custom_attribute(ai.GetPrim(), "sparkle:ai:maxDecisionDepth", 1, "int")
-            
-            # Physics - Minimal physics
-            physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics")
-            minimal_physics = UsdHelpers.create_xform(self.stage, "/Root/Enemy/Physics/MinimalPhysics")
-            UsdHelpers.add_custom_attribute(minimal_physics.GetPrim(), "sparkle:physics:collisionType", "simple", "string")
-        
-        # Create variants
-        UsdHelpers.edit_variant(self.enemy_prim, "complexityLOD", "high", create_high_lod)
-        UsdHelpers.edit_variant(self.enemy_prim, "complexityLOD", "medium", create_medium_lod)
-        UsdHelpers.edit_variant(self.enemy_prim, "complexityLOD", "low", create_low_lod)
+        # The whole enemy, with its prototypes and LOD variants, is parsed
+        # from one usda document into a sublayer of the stage, instead of
+        # being authored a prim and an attribute at a time
+        self._enemy_layer = Sdf.Layer.CreateAnonymous("enemy.usda")
+        self._enemy_layer.ImportFromString(_ENEMY_USDA)
+        self.stage.GetRootLayer().subLayerPaths.insert(0, self._enemy_layer.identifier)
+        self.enemy_prim = self.stage.GetPrimAtPath("/Root/Enemy")
         
         # Set initial variant selection
         UsdHelpers.set_variant_selection(self.enemy_prim, "complexityLOD", "high")
         
     def update(self, delta_time: float):
         """Update the demo state"""
+        # Read the enemy position once for this frame's update and render
+        self._cached_world_pos = UsdHelpers.get_world_position_cached(self.enemy_prim, self._xform_cache)
+        
         # Calculate distance from camera to enemy
         camera_pos = (
             self.app.camera.position.x,
             self.app.camera.position.y,
             self.app.camera.position.z
         )
-        self.camera_distance = UsdHelpers.get_distance_to_camera(
+        distance_sq = UsdHelpers.get_distance_sq_to_camera(
             self.stage, 
             "/Root/Enemy", 
-            camera_pos
+            camera_pos,
+            self._xform_cache
         )
         
+        # The distance itself is only needed for display
+        self.camera_distance = distance_sq ** 0.5
+        tenths = round(self.camera_distance * 10)
+        if tenths != self._distance_tenths:
+            self._distance_tenths = tenths
+            self._distance_label = f"Camera Distance: {tenths / 10:.1f}m"
+        
         # Update LOD based on distance if auto LOD is enabled
         if self.auto_lod:
-            if self.camera_distance < self.lod_thresholds["high"]:
-                new_lod = "high"
-            elif self.camera_distance < self.lod_thresholds["medium"]:
-                new_lod = "medium"
+            current = self.current_lod
+            farther = bisect_right(self._lod_bounds_far_sq, distance_sq)
+            nearer = bisect_right(self._lod_bounds_near_sq, distance_sq)
+            if farther > current:
+                new_index = farther
+            elif nearer < current:
+                new_index = nearer
             else:
-                new_lod = "low"
+                new_index = current
                 
-            if new_lod != self.current_lod:
-                self.current_lod = new_lod
-                UsdHelpers.set_variant_selection(self.enemy_prim, "complexityLOD", new_lod)
+            if new_index != current:
+                self._pending_variant = LOD(new_index)
+        
+        # Apply a requested LOD change, from auto LOD or last frame's UI
+        pending = self._pending_variant
+        if pending is not None:
+            self._pending_variant = None
+            if pending != self.current_lod:
+                self.current_lod = pending
+                UsdHelpers.set_variant_selection(self.enemy_prim, "complexityLOD", _LOD_ORDER[pending])
+    
+    def _update_lod_bounds(self):
+        """Rebuild the LOD distance bounds from the thresholds"""
+        high = self.lod_thresholds["high"]
+        # A medium threshold below the high one leaves no medium band
+        self._lod_bounds[0] = high
+        self._lod_bounds[1] = max(high, self.lod_thresholds["medium"])
+        for i, bound in enumerate(self._lod_bounds):
+            near = bound * (1.0 - LOD_HYSTERESIS)
+            far = bound * (1.0 + LOD_HYSTERESIS)
+            self._lod_bounds_near_sq[i] = near * near
+            self._lod_bounds_far_sq[i] = far * far
     
     def render(self):
         """Render the demo scene"""
         # Draw ground plane
         self.renderer.draw_grid(20, 1.0)
         
-        # Get current variant selection
-        variant_sets = self.enemy_prim.GetVariantSets()
-        variant_set = variant_sets.GetVariantSet("complexityLOD")
-        variant_selection = variant_set.GetVariantSelection()
+        # Skip the enemy, its subsystems and their labels when none of them
+        # can be on screen
+        x, y, z = self._cached_world_pos
+        cx, cy, cz = _ENEMY_BOUNDS_CENTER
+        if not self.renderer.is_box_visible((x + cx, y + cy, z + cz), _ENEMY_BOUNDS_HALF_EXTENT):
+            return
         
-        # Default to "high" if no variant is selected
-        if not variant_selection:
-            variant_selection = "high"
-            print(f"No variant selected, defaulting to {variant_selection}")
+        # Current variant selection; every selection made goes through
+        # current_lod, so the stage does not need to be asked
+        lod = self.current_lod
         
         # Draw enemy representation based on current LOD
-        position = UsdHelpers.get_world_position(self.enemy_prim)
+        position = self._cached_world_pos
         
         # Draw base cube representing the enemy
         self.renderer.draw_box(
             position,
             (2.0, 4.0, 2.0),
-            self.renderer.lod_colors[variant_selection],
+            self._lod_colors[lod],
             wire=False,
-            label=f"Enemy ({variant_selection.upper()})"
+            label=_ENEMY_LABELS[lod]
         )
         
         # Draw LOD indicator
         self.renderer.draw_lod_indicator(
             (position[0], position[1] + 2.5, position[2]),
-            variant_selection
+            _LOD_ORDER[lod]
         )
         
         # Draw subsystems based on current LOD
-        self._render_subsystems(variant_selection)
+        self._render_subsystems(lod)
     
-    def _render_subsystems(self, lod: str):
+    def _render_subsystems(self, lod: LOD):
         """Render visual representations of subsystems based on LOD"""
-        # Calculate base position from enemy prim
-        position = UsdHelpers.get_world_position(self.enemy_prim)
-        base_x, base_y, base_z = position
-        
-        # Draw appearance subsystem
-        if lod == "high":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, base_z),
-                "Polygons: 10,000",
-                14
-            )
-            # Indicate high detail mesh
-            self.renderer.draw_box(
-                (base_x, base_y, base_z),
-                (2.0, 4.0, 2.0),
-                (0, 150, 255, 100),
-                wire=True
-            )
-        elif lod == "medium":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, base_z),
-                "Polygons: 3,000",
-                14
-            )
-            # Indicate medium detail mesh
-            self.renderer.draw_box(
-                (base_x, base_y, base_z),
-                (1.9, 3.9, 1.9),
-                (0, 200, 100, 100),
-                wire=True
-            )
-        elif lod == "low":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, base_z),
-                "Polygons: 500",
-                14
-            )
-            # Indicate low detail mesh
-            self.renderer.draw_box(
-                (base_x, base_y, base_z),
-                (1.8, 3.8, 1.8),
-                (255, 200, 0, 100),
-                wire=True
-            )
-        
-        # Draw animation subsystem
-        anim_x = base_x - 3.0
-        self.renderer.draw_cylinder(
-            (anim_x, base_y, base_z),
-            0.5,
-            3.0,
-            self.renderer.system_colors["behavior"],
-            wire=False,
-            label="Animation"
+        display = _LOD_DISPLAY[lod]
+        
+        # World positions of everything drawn below, from one vectorized add
+        world = np.add(_RENDER_OFFSETS, self._cached_world_pos, out=self._render_positions)
+        positions = [tuple(row) for row in world.tolist()]
+        (animation_label_pos, ai_label_pos, physics_label_pos, mesh_pos) = positions[3:7]
+        collision_pos, distance_pos = positions[12:]
+        
+        # Draw the polygon, joint, AI, depth and collision details
+        for position, text in zip(positions[_DETAIL_LABEL_ROWS], _DETAIL_LABELS[lod]):
+            self.renderer.draw_text_3d(position, text, 14)
+        
+        # Indicate the detail mesh
+        self.renderer.draw_box(mesh_pos, display.mesh_size, display.mesh_color, wire=True)
+        
+        # Label the animation, behavior and physics subsystem markers, which
+        # the renderer draws as static geometry
+        for label, position in zip(_SUBSYSTEM_LABELS,
+                                   (animation_label_pos, ai_label_pos, physics_label_pos)):
+            self.renderer.draw_text_3d(position, label)
+        
+        # Draw the collision shape
+        x, y, z = collision_pos
+        display.collision_draw(
+            self.renderer,
+            (x, y + display.collision_y, z),
+            *display.collision_dims,
+            _COLLISION_COLOR,
+            wire=True
         )
         
-        if lod == "high":
-            self.renderer.draw_text_3d(
-                (anim_x, base_y + 3.5, base_z),
-                "Joints: 80",
-                14
-            )
-        elif lod == "medium":
-            self.renderer.draw_text_3d(
-                (anim_x, base_y + 3.5, base_z),
-                "Joints: 30",
-                14
-            )
-        elif lod == "low":
-            self.renderer.draw_text_3d(
-                (anim_x, base_y + 3.5, base_z),
-                "Joints: 10",
-                14
-            )
-        
-        # Draw behavior subsystem
-        ai_x = base_x + 3.0
-        self.renderer.draw_sphere(
-            (ai_x, base_y + 1.5, base_z),
-            1.0,
-            self.renderer.system_colors["physics"],
-            wire=False,
-            label="AI"
-        )
-        
-        if lod == "high":
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.0, base_z),
-                "Complex AI",
-                14
-            )
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.5, base_z),
-                "Depth: 5",
-                14
-            )
-        elif lod == "medium":
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.0, base_z),
-                "Basic AI",
-                14
-            )
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.5, base_z),
-                "Depth: 3",
-                14
-            )
-        elif lod == "low":
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.0, base_z),
-                "Stationary AI",
-                14
-            )
-            self.renderer.draw_text_3d(
-                (ai_x, base_y + 3.5, base_z),
-                "Depth: 1",
-                14
-            )
-        
-        # Draw physics subsystem
-        physics_z = base_z + 3.0
-        self.renderer.draw_box(
-            (base_x, base_y + 1.0, physics_z),
-            (1.0, 2.0, 1.0),
-            self.renderer.system_colors["visual"],
-            wire=False,
-            label="Physics"
-        )
-        
-        if lod == "high":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, physics_z),
-                "Collision: perBone",
-                14
-            )
-            # Draw detailed collision
-            self.renderer.draw_box(
-                (base_x, base_y + 1.0, physics_z),
-                (1.1, 2.1, 1.1),
-                (200, 50, 50, 100),
-                wire=True
-            )
-        elif lod == "medium":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, physics_z),
-                "Collision: capsule",
-                14
-            )
-            # Draw simplified collision
-            self.renderer.draw_cylinder(
-                (base_x, base_y, physics_z),
-                0.6,
-                3.0,
-                (200, 50, 50, 100),
-                wire=True
-            )
-        elif lod == "low":
-            self.renderer.draw_text_3d(
-                (base_x, base_y + 3.5, physics_z),
-                "Collision: simple",
-                14
-            )
-            # Draw simple collision
-            self.renderer.draw_sphere(
-                (base_x, base_y + 1.0, physics_z),
-                1.0,
-                (200, 50, 50, 100),
-                wire=True
-            )
-        
         # Draw camera distance information
-        self.renderer.draw_text_3d(
-            (base_x, base_y + 5.0, base_z),
-            f"Camera Distance: {self.camera_distance:.1f}m",
-            16
-        )
+        self.renderer.draw_text_3d(distance_pos, self._distance_label, 16)
     
     def render_ui(self):
         """Render UI elements for the demo"""
@@ -416,22 +519,27 @@ class VariantsDemo(Demo):
         self.ui.begin_panel("LOD Controls", x + 10, y + 10, 300, 350)
         
         # Display current LOD
-        self.ui.label(f"Current LOD: {self.current_lod.upper()}", x + 20, y + 40)
-        self.ui.label(f"Camera Distance: {self.camera_distance:.1f}m", x + 20, y + 70)
+        self.ui.label(_CURRENT_LOD_LABELS[self.current_lod], x + 20, y + 40)
+        self.ui.label(self._distance_label, x + 20, y + 70)
         
-        # Add LOD threshold sliders
+        # Add LOD threshold sliders; the bounds are only rebuilt when one moved
         y_offset = 110
-        for lod_name in ["high", "medium"]:
+        thresholds_changed = False
+        for lod_name, slider_label, slider_id in _THRESHOLD_SLIDERS:
             threshold = self.ui.slider_with_label(
-                f"{lod_name.capitalize()} LOD Threshold",
-                f"threshold_{lod_name}",
+                slider_label,
+                slider_id,
                 x + 20, y + y_offset,
                 260,
                 1.0, 30.0,
                 self.lod_thresholds[lod_name]
             )
-            self.lod_thresholds[lod_name] = threshold
+            if abs(threshold - self.lod_thresholds[lod_name]) > 1e-6:
+                self.lod_thresholds[lod_name] = threshold
+                thresholds_changed = True
             y_offset += 60
+        if thresholds_changed:
+            self._update_lod_bounds()
         
         # Add auto LOD toggle
         auto_lod = self.ui.checkbox(
@@ -448,17 +556,16 @@ class VariantsDemo(Demo):
             self.ui.label("Manual LOD Selection:", x + 20, y + y_offset)
             y_offset += 30
             
-            for lod_name in ["high", "medium", "low"]:
-                is_selected = self.current_lod == lod_name
+            for lod in LOD:
+                is_selected = self.current_lod == lod
                 if self.ui.button(
-                    lod_name.upper(),
-                    x + 20 + (["high", "medium", "low"].index(lod_name) * 90),
+                    _LOD_BUTTON_LABELS[lod],
+                    x + 20 + lod * 90,
                     y + y_offset,
                     80, 30,
                     is_selected
                 ):
-                    self.current_lod = lod_name
-                    UsdHelpers.set_variant_selection(self.enemy_prim, "complexityLOD", lod_name)
+                    self._pending_variant = lod
         
         # End panel
         self.ui.end_panel()
@@ -466,5 +573,6 @@ class VariantsDemo(Demo):
     def cleanup(self):
         """Clean up resources"""
         print("Cleaning up Variants Demo")
+        self.renderer.clear_static()
         self.stage = None
         self.enemy_prim = None
\ No newline at end of file
@@ -14,14 +14,6 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
 from demo_framework.app import DemoApplication
-from demos import (
-    variants_demo,
-    payloads_demo,
-    active_demo,
-    behavioral_lod_demo,
-    physics_lod_demo,
-    castle_lod_demo
-)
 
 def main():
     """Main entry point for the application"""
@@ -34,16 +26,16 @@ def main():
         height=720
     )
     
-    # Register demos
+    # Register demos by module path so each is only imported when selected
     # For now, only register the variants demo since it's the only one we've implemented
-    app.register_demo("Variants", variants_demo.VariantsDemo)
+    app.register_demo("Variants", "demos.variants_demo.VariantsDemo")
     
     # These will be uncommented as we implement each demo
-    # app.register_demo("Payloads", payloads_demo.PayloadsDemo)
-    # app.register_demo("Active Metadata", active_demo.ActiveDemo)
-    # app.register_demo("Behavioral LOD", behavioral_lod_demo.BehavioralLodDemo)
-    # app.register_demo("Physics LOD", physics_lod_demo.PhysicsLodDemo)
-    # app.register_demo("Castle LOD", castle_lod_demo.CastleLodDemo)
+    # app.register_demo("Payloads", "demos.payloads_demo.PayloadsDemo")
+    # app.register_demo("Active Metadata", "demos.active_demo.ActiveDemo")
+    # app.register_demo("Behavioral LOD", "demos.behavioral_lod_demo.BehavioralLodDemo")
+    # app.register_demo("Physics LOD", "demos.physics_lod_demo.PhysicsLodDemo")
+    # app.register_demo("Castle LOD", "demos.castle_lod_demo.CastleLodDemo")
     
     # Run application
     app.run()
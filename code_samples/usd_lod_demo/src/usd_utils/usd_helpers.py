@@ -3,17 +3,187 @@ USD Helper Utilities
 -------------------
 Provides helper functions for working with USD stages, prims, and properties.
 Simplifies common operations for the LOD demos.
+
+Problems are reported through the "usd_utils.usd_helpers" logger. Lookups that
+miss, and that the caller already sees as a False return, are logged at debug
+level; raise the logger's level to silence everything below errors.
 """
 
+import logging
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Optional, Any, Union
 
+import numpy as np
 from pxr import Usd, UsdGeom, Sdf, Gf, Tf, Vt
 
+_log = logging.getLogger(__name__)
+
+# Variant set handles cached by set_variant_selection before the cache is cleared
+VARIANT_SET_CACHE_SIZE = 1024
+
+# Prims whose xform ops set_transform keeps before the cache is cleared
+XFORM_OP_CACHE_SIZE = 4096
+
+# USD values and tokens used on every call, resolved once at import so the
+# first frame does not pay for their lookup
+_DEFAULT_TIME = Usd.TimeCode.Default()
+_OP_TRANSLATE = UsdGeom.XformOp.GetOpName(UsdGeom.XformOp.TypeTranslate)
+_OP_ROTATE_XYZ = UsdGeom.XformOp.GetOpName(UsdGeom.XformOp.TypeRotateXYZ)
+_OP_SCALE = UsdGeom.XformOp.GetOpName(UsdGeom.XformOp.TypeScale)
+_OP_ORDER = UsdGeom.Tokens.xformOpOrder
+_TT_DOUBLE3 = Sdf.ValueTypeNames.Double3
+_TT_FLOAT3 = Sdf.ValueTypeNames.Float3
+_TT_TOKEN_ARRAY = Sdf.ValueTypeNames.TokenArray
+_IDENTITY = Gf.Matrix4d(1.0)
+
+# Attribute value types auto-detected from the exact Python type of a value,
+# in isinstance precedence order for subclasses such as numpy scalars
+_VALUE_TYPES_BY_PY_TYPE = {
+    bool: Sdf.ValueTypeNames.Bool,
+    int: Sdf.ValueTypeNames.Int,
+    float: Sdf.ValueTypeNames.Float,
+    str: Sdf.ValueTypeNames.String,
+}
+
+# Attribute value types by type name, filled from Sdf.ValueTypeNames.Find on
+# first use of each name
+_value_types_by_name: Dict[str, Sdf.ValueTypeName] = {
+    "bool": Sdf.ValueTypeNames.Bool,
+    "int": Sdf.ValueTypeNames.Int,
+    "float": Sdf.ValueTypeNames.Float,
+    "string": Sdf.ValueTypeNames.String,
+    "float3": _TT_FLOAT3,
+}
+
+
+@lru_cache(maxsize=4096)
+def _as_sdf_path(path: str) -> Sdf.Path:
+    """Sdf.Path for a path string, parsed once per distinct string"""
+    return Sdf.Path(path)
+
+
+def _squared_distances(positions: np.ndarray, point: np.ndarray,
+                       offsets: Optional[np.ndarray] = None,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Squared distances from each row of an (N, 3) float64 array to a point,
+    optionally written through caller-owned (N, 3) and (N,) buffers
+    """
+    offsets = np.subtract(positions, point, out=offsets)
+    # Row-wise dot product in one pass, without a squared temporary
+    return np.einsum("ij,ij->i", offsets, offsets, out=out)
+
+
+class PositionSoA:
+    """
+    World positions of a fixed list of prims, kept in one (N, 3) array and
+    refreshed once per frame so distance and culling queries can share them
+    """
+    
+    def __init__(self, paths: Iterable[str]):
+        self.paths: List[str] = list(paths)
+        self._sdf_paths = [_as_sdf_path(path) for path in self.paths]
+        self.positions = np.zeros((len(self.paths), 3), dtype=np.float64)
+        # Whether each prim was found by the last refresh
+        self.valid = np.zeros(len(self.paths), dtype=bool)
+        # Buffers the distance queries write into instead of allocating
+        self._offsets = np.empty_like(self.positions)
+        self._distances = np.empty(len(self.paths), dtype=np.float64)
+    
+    def refresh(self, stage: Usd.Stage, time: Optional[float] = None,
+                xform_cache: Optional[UsdGeom.XformCache] = None):
+        """
+        Read every prim's world position through one transform cache
+        
+        Args:
+            stage: USD stage
+            time: Optional time, used when no cache is given
+            xform_cache: Optional transform cache reused across calls
+        """
+        if xform_cache is None:
+            xform_cache = UsdGeom.XformCache(_DEFAULT_TIME if time is None else Usd.TimeCode(time))
+        
+        # Gather the world matrices, with the identity standing in for prims
+        # not found, then take every translation row in one array conversion
+        matrices = []
+        valid = self.valid
+        for i, path in enumerate(self._sdf_paths):
+            prim = stage.GetPrimAtPath(path)
+            valid[i] = bool(prim)
+            matrices.append(xform_cache.GetLocalToWorldTransform(prim) if prim else _IDENTITY)
+        if matrices:
+            self.positions[:] = np.array(matrices, dtype=np.float64)[:, 3, :3]
+    
+    def squared_distances_to(self, point: Tuple[float, float, float]) -> np.ndarray:
+        """
+        Squared distances from each prim to a point (inf for prims not found).
+        The array is reused by the next distance query; copy it to keep it.
+        """
+        distances = _squared_distances(self.positions, np.asarray(point, dtype=np.float64),
+                                       self._offsets, self._distances)
+        distances[~self.valid] = np.inf
+        return distances
+    
+    def distances_to(self, point: Tuple[float, float, float]) -> np.ndarray:
+        """
+        Distances from each prim to a point (inf for prims not found).
+        The array is reused by the next distance query; copy it to keep it.
+        """
+        return np.sqrt(self.squared_distances_to(point), out=self._distances)
+
+
 class UsdHelpers:
     """Helper class for USD operations"""
     
+    # Transform cache shared by get_world_transform between begin_frame() and
+    # end_frame(), and the time it was created for
+    _xform_cache: Optional[UsdGeom.XformCache] = None
+    _xform_cache_time: Optional[Usd.TimeCode] = None
+    
+    # Variant set handles and their variant names by (prim, variant set name)
+    _variant_set_cache: Dict[Tuple[Usd.Prim, str], Tuple[Usd.VariantSet, FrozenSet[str]]] = {}
+    
+    # Xform ops authored through set_transform by prim, then by op name
+    _xform_op_cache: Dict[Usd.Prim, Dict[str, UsdGeom.XformOp]] = {}
+    
+    @classmethod
+    def invalidate_caches(cls, stage: Optional[Usd.Stage] = None):
+        """
+        Forget cached variant sets and xform ops, after variants were added,
+        xform ops were changed outside set_transform, or prims were removed
+        
+        Args:
+            stage: Only forget entries for prims on this stage; all if None
+        """
+        if stage is None:
+            cls._variant_set_cache.clear()
+            cls._xform_op_cache.clear()
+            return
+        for key in [key for key in cls._variant_set_cache if key[0].GetStage() == stage]:
+            del cls._variant_set_cache[key]
+        for prim in [prim for prim in cls._xform_op_cache if prim.GetStage() == stage]:
+            del cls._xform_op_cache[prim]
+    
+    @classmethod
+    def begin_frame(cls, time: Optional[float] = None):
+        """
+        Start sharing one transform cache across world transform queries
+        
+        Args:
+            time: Optional time the queries are made at
+        """
+        cls._xform_cache_time = _DEFAULT_TIME if time is None else Usd.TimeCode(time)
+        cls._xform_cache = UsdGeom.XformCache(cls._xform_cache_time)
+    
+    @classmethod
+    def end_frame(cls):
+        """Drop the shared transform cache so stale transforms are not reused"""
+        cls._xform_cache = None
+        cls._xform_cache_time = None
+    
     @staticmethod
     def create_stage(output_path: Optional[str] = None) -> Usd.Stage:
         """
@@ -30,18 +200,34 @@ class UsdHelpers:
         else:
             stage = Usd.Stage.CreateInMemory()
             
-        # Set up stage defaults
-        UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.y)
-        
-        # Set meters per unit to 1.0 (Raylib uses meters)
-        stage.SetMetadata("metersPerUnit", 1.0)
+        # Set up stage defaults, sending one change notice for both
+        with Sdf.ChangeBlock():
+            UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.y)
+            
+            # Set meters per unit to 1.0 (Raylib uses meters)
+            stage.SetMetadata("metersPerUnit", 1.0)
         
-        # Set default prim
+        # Set default prim; the prim must be composed before it is used, so
+        # this stays outside the change block
         root_prim = stage.DefinePrim("/Root", "Xform")
         stage.SetDefaultPrim(root_prim)
         
         return stage
     
+    @staticmethod
+    @contextmanager
+    def batch_edit():
+        """
+        Coalesce the change notices of the edits made inside the block into one.
+        
+        Use it around many value edits, such as setting attributes or variant
+        selections on existing prims. Prims defined inside the block are not
+        composed until it ends, so do not define prims and then use them in
+        the same block.
+        """
+        with Sdf.ChangeBlock():
+            yield
+    
     @staticmethod
     def save_stage(stage: Usd.Stage, file_path: str) -> bool:
         """
@@ -58,7 +244,7 @@ class UsdHelpers:
             stage.GetRootLayer().Export(file_path)
             return True
         except Exception as e:
-            print(f"Error saving stage: {e}")
+            _log.warning("Error saving stage: %s", e)
             return False
     
     @staticmethod
@@ -75,7 +261,7 @@ class UsdHelpers:
         try:
             return Usd.Stage.Open(file_path)
         except Exception as e:
-            print(f"Error loading stage: {e}")
+            _log.warning("Error loading stage: %s", e)
             return None
     
     @staticmethod
@@ -165,28 +351,95 @@ class UsdHelpers:
         
         # Use default time if not specified
         if time is None:
-            time = Usd.TimeCode.Default()
+            time = _DEFAULT_TIME
+        
+        # Ops already authored by an earlier call are reused, so the prim can
+        # be transformed again without adding duplicate ops. They are read from
+        # the prim once and then kept with the prim's other cached ops
+        ops = UsdHelpers._xform_op_cache.get(prim)
+        if ops is None:
+            ops = {op.GetOpName(): op for op in xform.GetOrderedXformOps()}
+            if len(UsdHelpers._xform_op_cache) >= XFORM_OP_CACHE_SIZE:
+                UsdHelpers._xform_op_cache.clear()
+            UsdHelpers._xform_op_cache[prim] = ops
         
         # Apply translation
         if translation:
-            translation_op = xform.AddTranslateOp()
+            translation_op = ops.get(_OP_TRANSLATE)
+            if translation_op is None:
+                translation_op = ops[_OP_TRANSLATE] = xform.AddTranslateOp()
             translation_op.Set(Gf.Vec3d(*translation), time)
         
-        # Apply rotation (in degrees, XYZ order)
+        # Apply rotation (in degrees, XYZ order) as a single op
         if rotation:
-            rotation_op_x = xform.AddRotateXOp()
-            rotation_op_y = xform.AddRotateYOp()
-            rotation_op_z = xform.AddRotateZOp()
-            
-            rotation_op_x.Set(rotation[0], time)
-            rotation_op_y.Set(rotation[1], time)
-            rotation_op_z.Set(rotation[2], time)
+            rotation_op = ops.get(_OP_ROTATE_XYZ)
+            if rotation_op is None:
+                rotation_op = ops[_OP_ROTATE_XYZ] = xform.AddRotateXYZOp()
+            rotation_op.Set(Gf.Vec3f(*rotation), time)
         
         # Apply scale
         if scale:
-            scale_op = xform.AddScaleOp()
+            scale_op = ops.get(_OP_SCALE)
+            if scale_op is None:
+                scale_op = ops[_OP_SCALE] = xform.AddScaleOp()
             scale_op.Set(Gf.Vec3d(*scale), time)
     
+    @staticmethod
+    def set_transforms_bulk(stage: Usd.Stage,
+                            items: Iterable[Tuple[str,
+                                                  Optional[Tuple[float, float, float]],
+                                                  Optional[Tuple[float, float, float]],
+                                                  Optional[Tuple[float, float, float]]]]):
+        """
+        Set the default-time transforms of many prims at once. The ops are
+        written straight into the edit target layer in one change block, which
+        is the fast route for authoring many static prims; use set_transform
+        for one-off and time-sampled edits. Any ops authored on the prims in
+        that layer before are replaced.
+        
+        Args:
+            stage: USD stage
+            items: (prim path, translation, rotation, scale) per prim, each
+                transform component being an optional (x, y, z) as in
+                set_transform
+        """
+        layer = stage.GetEditTarget().GetLayer()
+        paths = []
+        with Sdf.ChangeBlock():
+            for path, translation, rotation, scale in items:
+                ops = [
+                    op for op in (
+                        (_OP_TRANSLATE, _TT_DOUBLE3, Gf.Vec3d, translation),
+                        (_OP_ROTATE_XYZ, _TT_FLOAT3, Gf.Vec3f, rotation),
+                        (_OP_SCALE, _TT_FLOAT3, Gf.Vec3f, scale),
+                    ) if op[3]
+                ]
+                # Like set_transform, an item with no components leaves the
+                # prim's transform alone
+                if not ops:
+                    continue
+                
+                prim_path = _as_sdf_path(path)
+                paths.append(prim_path)
+                prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+                
+                op_order = []
+                for op_name, value_type, vec_type, value in ops:
+                    attr_spec = prim_spec.attributes.get(op_name)
+                    if attr_spec is None:
+                        attr_spec = Sdf.AttributeSpec(prim_spec, op_name, value_type)
+                    attr_spec.default = vec_type(*value)
+                    op_order.append(op_name)
+                
+                order_spec = prim_spec.attributes.get(_OP_ORDER)
+                if order_spec is None:
+                    order_spec = Sdf.AttributeSpec(prim_spec, _OP_ORDER, _TT_TOKEN_ARRAY, Sdf.VariabilityUniform)
+                order_spec.default = Vt.TokenArray(op_order)
+        
+        # The ops set_transform cached for these prims may no longer match
+        for prim_path in paths:
+            UsdHelpers._xform_op_cache.pop(stage.GetPrimAtPath(prim_path), None)
+    
     @staticmethod
     def get_world_transform(prim: Usd.Prim, time: Optional[float] = None) -> Gf.Matrix4d:
         """
@@ -199,17 +452,20 @@ class UsdHelpers:
         Returns:
             World transform matrix
         """
-        xform = UsdGeom.Xformable(prim)
-        
         # Use default time if not specified
         if time is None:
-            time = Usd.TimeCode.Default()
+            time = _DEFAULT_TIME
+        
+        # Within a frame, share ancestor transforms through the frame's cache
+        cache = UsdHelpers._xform_cache
+        if cache is not None and Usd.TimeCode(time) == UsdHelpers._xform_cache_time:
+            return cache.GetLocalToWorldTransform(prim)
         
         # Get world transform
-        return xform.ComputeLocalToWorldTransform(time)
+        return UsdGeom.Xformable(prim).ComputeLocalToWorldTransform(time)
     
     @staticmethod
-    def get_world_position(prim: Usd.Prim, time: Optional[float] = None) -> Tuple[float, float, float]:
+    def get_world_position(prim: Usd.Prim, time: Optional[float] = None) -> Gf.Vec3d:
         """
         Get world position for a prim
         
@@ -217,11 +473,39 @@ class UsdHelpers:
             prim: USD prim
             time: Optional time
             
+        Returns:
+            World position, indexable and unpackable like an (x, y, z) tuple
+        """
+        return UsdHelpers.get_world_transform(prim, time).ExtractTranslation()
+    
+    @staticmethod
+    def get_world_position_tuple(prim: Usd.Prim, time: Optional[float] = None) -> Tuple[float, float, float]:
+        """
+        Get world position for a prim as plain floats
+        
+        Args:
+            prim: USD prim
+            time: Optional time
+            
+        Returns:
+            (x, y, z) world position
+        """
+        translation = UsdHelpers.get_world_position(prim, time)
+        return (translation[0], translation[1], translation[2])
+    
+    @staticmethod
+    def get_world_position_cached(prim: Usd.Prim, xform_cache: UsdGeom.XformCache) -> Tuple[float, float, float]:
+        """
+        Get world position for a prim through a caller-owned transform cache
+        
+        Args:
+            prim: USD prim
+            xform_cache: Cache reused across calls; clear it when transforms change
+            
         Returns:
             (x, y, z) world position
         """
-        matrix = UsdHelpers.get_world_transform(prim, time)
-        translation = matrix.ExtractTranslation()
+        translation = xform_cache.GetLocalToWorldTransform(prim).ExtractTranslation()
         return (translation[0], translation[1], translation[2])
     
     @staticmethod
@@ -243,19 +527,23 @@ class UsdHelpers:
             variant_sets = prim.GetVariantSets()
             variant_set = variant_sets.AddVariantSet(variant_set_name)
             
-            # Add variants - check if they exist first using GetVariantNames
-            variant_names = variant_set.GetVariantNames()
+            # The cached variant names for this set are about to go stale
+            UsdHelpers._variant_set_cache.pop((prim, variant_set_name), None)
+            
+            # Add variants - check if they exist first, fetching the names once
+            variant_names = set(variant_set.GetVariantNames())
             for variant in variants:
                 if variant not in variant_names:
                     variant_set.AddVariant(variant)
+                    variant_names.add(variant)
             
             # Set default variant if specified
-            if default_variant and default_variant in variant_set.GetVariantNames():
+            if default_variant and default_variant in variant_names:
                 variant_set.SetVariantSelection(default_variant)
                 
             return variant_set
         except Exception as e:
-            print(f"Error creating variant set: {e}")
+            _log.warning("Error creating variant set: %s", e)
             return None
     
     @staticmethod
@@ -279,7 +567,7 @@ class UsdHelpers:
             
             # Check if variant exists using GetVariantNames
             if variant_name not in variant_set.GetVariantNames():
-                print(f"Variant {variant_name} not found in {variant_set_name}")
+                _log.debug("Variant %s not found in %s", variant_name, variant_set_name)
                 return False
             
             with variant_set.GetVariantEditContext(variant_name):
@@ -287,7 +575,7 @@ class UsdHelpers:
                 
             return True
         except Exception as e:
-            print(f"Error editing variant: {e}")
+            _log.warning("Error editing variant: %s", e)
             return False
     
     @staticmethod
@@ -303,20 +591,32 @@ class UsdHelpers:
         Returns:
             True if successful
         """
-        try:
-            variant_sets = prim.GetVariantSets()
-            variant_set = variant_sets.GetVariantSet(variant_set_name)
-            
-            # Check if variant exists using GetVariantNames
-            if variant_name not in variant_set.GetVariantNames():
-                print(f"Variant {variant_name} not found in {variant_set_name}")
-                return False
-            
-            variant_set.SetVariantSelection(variant_name)
-            return True
-        except Exception as e:
-            print(f"Error setting variant selection: {e}")
+        # An expired prim would raise below
+        if not prim:
+            _log.debug("Invalid prim for variant set %s", variant_set_name)
             return False
+        
+        # Reuse the variant set handle and names from earlier selections
+        key = (prim, variant_set_name)
+        cached = UsdHelpers._variant_set_cache.get(key)
+        if cached is None:
+            variant_set = prim.GetVariantSets().GetVariantSet(variant_set_name)
+            variant_names = frozenset(variant_set.GetVariantNames())
+            # A missing variant set is not cached, so it is found once created
+            if variant_names:
+                cache = UsdHelpers._variant_set_cache
+                if len(cache) >= VARIANT_SET_CACHE_SIZE:
+                    cache.clear()
+                cache[key] = (variant_set, variant_names)
+        else:
+            variant_set, variant_names = cached
+        
+        # Check if variant exists
+        if variant_name not in variant_names:
+            _log.debug("Variant %s not found in %s", variant_name, variant_set_name)
+            return False
+        
+        return variant_set.SetVariantSelection(variant_name)
     
     @staticmethod
     def create_payload(stage: Usd.Stage, path: str, asset_path: str, prim_path: str = "/") -> Usd.Prim:
@@ -348,17 +648,12 @@ class UsdHelpers:
         Returns:
             True if successful
         """
-        try:
-            prim = stage.GetPrimAtPath(path)
-            if not prim:
-                print(f"Prim {path} not found")
-                return False
-                
-            stage.LoadPayload(prim)
-            return True
-        except Exception as e:
-            print(f"Error loading payload: {e}")
+        prim = stage.GetPrimAtPath(_as_sdf_path(path))
+        if not prim:
+            _log.debug("Prim %s not found", path)
             return False
+            
+        return UsdHelpers.apply_payload_diff(stage, (path,), ())
     
     @staticmethod
     def unload_payload(stage: Usd.Stage, path: str) -> bool:
@@ -369,19 +664,67 @@ class UsdHelpers:
             stage: USD stage
             path: Prim path
             
+        Returns:
+            True if successful
+        """
+        prim = stage.GetPrimAtPath(_as_sdf_path(path))
+        if not prim:
+            _log.debug("Prim %s not found", path)
+            return False
+            
+        return UsdHelpers.apply_payload_diff(stage, (), (path,))
+    
+    @staticmethod
+    def load_payloads(stage: Usd.Stage, paths: Iterable[str]) -> bool:
+        """
+        Load the payloads of several prims in one recomposition
+        
+        Args:
+            stage: USD stage
+            paths: Prim paths
+            
+        Returns:
+            True if successful
+        """
+        return UsdHelpers.apply_payload_diff(stage, paths, ())
+    
+    @staticmethod
+    def unload_payloads(stage: Usd.Stage, paths: Iterable[str]) -> bool:
+        """
+        Unload the payloads of several prims in one recomposition
+        
+        Args:
+            stage: USD stage
+            paths: Prim paths
+            
+        Returns:
+            True if successful
+        """
+        return UsdHelpers.apply_payload_diff(stage, (), paths)
+    
+    @staticmethod
+    def apply_payload_diff(stage: Usd.Stage, to_load: Iterable[str], to_unload: Iterable[str]) -> bool:
+        """
+        Load and unload payloads in one recomposition. LOD code can collect a
+        frame's payload changes and apply them here once.
+        
+        Args:
+            stage: USD stage
+            to_load: Paths of prims whose payloads to load, with descendants
+            to_unload: Paths of prims whose payloads to unload
+            
         Returns:
             True if successful
         """
         try:
-            prim = stage.GetPrimAtPath(path)
-            if not prim:
-                print(f"Prim {path} not found")
-                return False
-                
-            stage.UnloadPayload(prim)
+            stage.LoadAndUnload(
+                {_as_sdf_path(path) for path in to_load},
+                {_as_sdf_path(path) for path in to_unload},
+                Usd.LoadWithDescendants
+            )
             return True
         except Exception as e:
-            print(f"Error unloading payload: {e}")
+            _log.warning("Error applying payload changes: %s", e)
             return False
     
     @staticmethod
@@ -397,17 +740,12 @@ class UsdHelpers:
         Returns:
             True if successful
         """
-        try:
-            prim = stage.GetPrimAtPath(path)
-            if not prim:
-                print(f"Prim {path} not found")
-                return False
-                
-            prim.SetActive(active)
-            return True
-        except Exception as e:
-            print(f"Error setting active state: {e}")
+        prim = stage.GetPrimAtPath(_as_sdf_path(path))
+        if not prim:
+            _log.debug("Prim %s not found", path)
             return False
+            
+        return prim.SetActive(active)
     
     @staticmethod
     def get_active(stage: Usd.Stage, path: str) -> bool:
@@ -421,9 +759,9 @@ class UsdHelpers:
         Returns:
             Active state (False if prim not found)
         """
-        prim = stage.GetPrimAtPath(path)
+        prim = stage.GetPrimAtPath(_as_sdf_path(path))
         if not prim:
-            print(f"Prim {path} not found")
+            _log.debug("Prim %s not found", path)
             return False
             
         return prim.IsActive()
@@ -446,32 +784,34 @@ class UsdHelpers:
         try:
             # Auto-detect type if not provided
             if type_name is None:
-                if isinstance(value, bool):
-                    type_name = "bool"
-                elif isinstance(value, int):
-                    type_name = "int"
-                elif isinstance(value, float):
-                    type_name = "float"
-                elif isinstance(value, str):
-                    type_name = "string"
-                elif isinstance(value, (tuple, list)) and len(value) == 3:
-                    # Assume float3 for 3-element tuples/lists
-                    type_name = "float3"
-                else:
-                    print(f"Unsupported value type: {type(value)}")
-                    return None
+                value_type = _VALUE_TYPES_BY_PY_TYPE.get(type(value))
+                if value_type is None:
+                    value_type = next((vt for py_type, vt in _VALUE_TYPES_BY_PY_TYPE.items()
+                                       if isinstance(value, py_type)), None)
+                if value_type is None:
+                    if isinstance(value, (tuple, list)) and len(value) == 3:
+                        # Assume float3 for 3-element tuples/lists
+                        value_type = _TT_FLOAT3
+                    else:
+                        _log.warning("Unsupported value type: %s", type(value))
+                        return None
+            else:
+                value_type = _value_types_by_name.get(type_name)
+                if value_type is None:
+                    value_type = Sdf.ValueTypeNames.Find(type_name)
+                    _value_types_by_name[type_name] = value_type
             
             # Create attribute
-            attr = prim.CreateAttribute(name, Sdf.ValueTypeNames.Find(type_name))
+            attr = prim.CreateAttribute(name, value_type)
             if not attr:
-                print(f"Failed to create attribute: {name}")
+                _log.warning("Failed to create attribute: %s", name)
                 return None
                 
             # Set value
             attr.Set(value)
             return attr
         except Exception as e:
-            print(f"Error adding custom attribute: {e}")
+            _log.warning("Error adding custom attribute: %s", e)
             return None
     
     @staticmethod
@@ -487,11 +827,14 @@ class UsdHelpers:
         Returns:
             Attribute value or default value
         """
+        # Only read the value when there is one to read
         attr = prim.GetAttribute(name)
-        if not attr:
+        if not attr or not attr.HasValue():
             return default_value
             
-        return attr.Get() or default_value
+        # Falsy values such as 0 or "" are real values, not missing ones
+        value = attr.Get()
+        return default_value if value is None else value
     
     @staticmethod
     def set_attribute_value(prim: Usd.Prim, name: str, value: Any, time: Optional[float] = None) -> bool:
@@ -510,7 +853,7 @@ class UsdHelpers:
         try:
             attr = prim.GetAttribute(name)
             if not attr:
-                print(f"Attribute {name} not found")
+                _log.debug("Attribute %s not found", name)
                 return False
                 
             if time is None:
@@ -520,7 +863,7 @@ class UsdHelpers:
                 
             return True
         except Exception as e:
-            print(f"Error setting attribute value: {e}")
+            _log.warning("Error setting attribute value: %s", e)
             return False
     
     @staticmethod
@@ -537,15 +880,60 @@ class UsdHelpers:
         Returns:
             Distance (or float('inf') if prim not found)
         """
-        prim = stage.GetPrimAtPath(prim_path)
+        return UsdHelpers.get_distance_sq_to_camera(stage, prim_path, camera_position) ** 0.5
+    
+    @staticmethod
+    def get_distance_sq_to_camera(stage: Usd.Stage, prim_path: str,
+                                  camera_position: Tuple[float, float, float],
+                                  xform_cache: Optional[UsdGeom.XformCache] = None) -> float:
+        """
+        Calculate squared distance from a prim to camera position. Cheaper than
+        get_distance_to_camera for comparisons against squared thresholds.
+        
+        Args:
+            stage: USD stage
+            prim_path: Path to the prim
+            camera_position: (x, y, z) camera position
+            xform_cache: Optional transform cache reused across calls
+            
+        Returns:
+            Squared distance (or float('inf') if prim not found)
+        """
+        prim = stage.GetPrimAtPath(_as_sdf_path(prim_path))
         if not prim:
             return float('inf')
-            
-        prim_position = UsdHelpers.get_world_position(prim)
         
-        # Calculate distance
-        dx = camera_position[0] - prim_position[0]
-        dy = camera_position[1] - prim_position[1]
-        dz = camera_position[2] - prim_position[2]
+        if xform_cache is None:
+            prim_position = UsdHelpers.get_world_position(prim)
+        else:
+            prim_position = xform_cache.GetLocalToWorldTransform(prim).ExtractTranslation()
+        
+        # Subtract and measure in Gf rather than in Python floats
+        return (Gf.Vec3d(*camera_position) - prim_position).GetLengthSq()
+    
+    @staticmethod
+    def compute_distances_batch(stage: Usd.Stage, prim_paths: Union[List[str], PositionSoA],
+                                camera_position: Tuple[float, float, float],
+                                xform_cache: Optional[UsdGeom.XformCache] = None) -> np.ndarray:
+        """
+        Calculate distances from many prims to camera position at once. One
+        transform cache is shared by all the prims, so common ancestors are
+        only composed once.
         
-        return (dx * dx + dy * dy + dz * dz) ** 0.5
\ No newline at end of file
+        Args:
+            stage: USD stage
+            prim_paths: Paths to the prims, or a PositionSoA kept across calls
+                so its path parsing and buffers are reused; its distances
+                array is then overwritten by the next query
+            camera_position: (x, y, z) camera position
+            xform_cache: Optional transform cache reused across calls
+            
+        Returns:
+            Distances in prim_paths order (inf for prims not found)
+        """
+        if isinstance(prim_paths, PositionSoA):
+            positions = prim_paths
+        else:
+            positions = PositionSoA(prim_paths)
+        positions.refresh(stage, xform_cache=xform_cache)
+        return positions.distances_to(camera_position)